@@ -5,7 +5,9 @@ Provides framework-agnostic REST endpoints for evaluating governance decisions.
 """
 
 import os
+import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
@@ -35,6 +37,9 @@ from governance_gate.api.config import config
 POLICY_BASE_DIR = os.environ.get("GOVGATE_POLICY_DIR", "./policies/presets")
 API_VERSION = "0.1.0"
 
+# Compiled policy evaluators kept at once; each holds its own result cache
+MAX_POLICY_EVALUATORS = 32
+
 # Create FastAPI app
 app = FastAPI(
     title="Governance Gate API",
@@ -65,6 +70,49 @@ def create_pipeline() -> GovernancePipeline:
     )
 
 
+# Shared across requests so the gates are built once
+_pipeline: Optional[GovernancePipeline] = None
+
+# Compiled evaluator per resolved policy file, paired with the policy dict it
+# was built from, in LRU order. PolicyLoader returns the same validated dict
+# until the file changes.
+_policy_evaluators: OrderedDict[str, tuple[dict, PolicyEvaluator]] = OrderedDict()
+_policy_evaluators_lock = threading.Lock()
+
+
+def get_pipeline() -> GovernancePipeline:
+    """Get the shared default governance pipeline."""
+    global _pipeline
+
+    if _pipeline is None:
+        _pipeline = create_pipeline()
+    return _pipeline
+
+
+def get_policy_evaluator(policy_path: Path, policy_dict: dict) -> PolicyEvaluator:
+    """
+    Get the compiled evaluator for a loaded policy, compiling it on first use.
+
+    Evaluators are keyed on the resolved file path, so spellings such as
+    "x.yaml" and "./x.yaml" share one, and at most MAX_POLICY_EVALUATORS
+    are kept.
+    """
+    key = str(policy_path.resolve())
+    with _policy_evaluators_lock:
+        cached = _policy_evaluators.get(key)
+        if cached is not None and cached[0] is policy_dict:
+            _policy_evaluators.move_to_end(key)
+            return cached[1]
+
+    evaluator = PolicyEvaluator(policy_dict)
+    with _policy_evaluators_lock:
+        _policy_evaluators[key] = (policy_dict, evaluator)
+        _policy_evaluators.move_to_end(key)
+        if len(_policy_evaluators) > MAX_POLICY_EVALUATORS:
+            _policy_evaluators.popitem(last=False)
+    return evaluator
+
+
 # ============================================================================
 # Endpoints
 # ============================================================================
@@ -120,19 +168,14 @@ async def evaluate_decision(request: GovernanceRequest):
                 loader = get_policy_loader(request.policy_path)
                 policy_dict = loader.load()
 
-                # Validate policy structure
+                # The loader has already validated the policy structure
                 try:
-                    from governance_gate.policy.schema_validation import validate_policy_schema
-                    errors = validate_policy_schema(policy_dict)
-                    if errors:
-                        raise PolicyValidationError(f"Policy validation failed: {', '.join(errors)}")
-
                     # Extract policy metadata for tracking
                     policy_name = policy_dict.get("name")
                     policy_version = policy_dict.get("version")
 
-                    # Create policy evaluator with loaded policy
-                    policy_evaluator = PolicyEvaluator(policy_dict)
+                    # Reuse the evaluator compiled for this policy
+                    policy_evaluator = get_policy_evaluator(loader.policy_path, policy_dict)
                 except Exception as validation_error:
                     # Policy file exists but is invalid
                     policy_evaluator = None
@@ -207,9 +250,8 @@ async def evaluate_decision(request: GovernanceRequest):
             metadata=request.evidence.metadata,
         )
 
-        # Create pipeline and evaluate
-        pipeline = create_pipeline()
-        decision = pipeline.evaluate(intent, context, evidence, policy_evaluator)
+        # Evaluate with the shared pipeline
+        decision = get_pipeline().evaluate(intent, context, evidence, policy_evaluator)
 
         # Calculate latency
         latency_ms = (time.time() - start_time) * 1000
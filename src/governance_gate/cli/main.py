@@ -4,6 +4,7 @@ CLI for the governance gate system.
 Provides commands:
 - govgate eval: Evaluate a case and get a decision
 - govggate validate: Validate a policy file
+- govgate lint: Report every schema error in a policy file
 """
 
 import sys
@@ -13,13 +14,14 @@ from pathlib import Path
 from typing import Any
 
 import click
+import yaml
 
 from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
 from governance_gate.core.pipeline import GovernancePipeline
 from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate, SafetyGate
 from governance_gate.policy.loader import PolicyLoader
 from governance_gate.policy.evaluator import PolicyEvaluator
-from governance_gate.policy.schema_validation import PolicyValidationError
+from governance_gate.policy.schema_validation import PolicyValidationError, validate_policy_schema
 from governance_gate.core.errors import GovernanceError, PolicyError
 
 
@@ -194,6 +196,40 @@ def validate(policy_file: Path) -> None:
         sys.exit(1)
 
 
+@cli.command()
+@click.argument("policy_file", type=click.Path(exists=True, path_type=Path))
+def lint(policy_file: Path) -> None:
+    """
+    Report every schema error in a policy YAML file.
+
+    Unlike validate, which stops at the first invalid section, lint checks
+    the whole policy.
+
+    POLICY_FILE: Path to the policy YAML file to lint.
+    """
+    try:
+        # Parsed exactly as PolicyLoader parses it, so lint and load agree
+        policy = PolicyLoader.parse_yaml(policy_file.read_bytes())
+    except yaml.YAMLError as e:
+        click.echo(f"✗ Failed to parse YAML: {e}", err=True)
+        sys.exit(1)
+
+    if not isinstance(policy, dict):
+        click.echo(f"✗ Policy file must contain a dictionary, got {type(policy).__name__}", err=True)
+        sys.exit(1)
+
+    try:
+        validate_policy_schema(policy)
+    except PolicyValidationError as e:
+        click.echo(f"✗ {e}", err=True)
+        for error in e.errors:
+            click.echo(f"  - {error}", err=True)
+        sys.exit(1)
+
+    click.echo(f"✓ Policy '{policy.get('name', 'unnamed')}' has no schema errors")
+    sys.exit(0)
+
+
 @cli.command()
 @click.option(
     "--host",
@@ -213,11 +249,19 @@ def validate(policy_file: Path) -> None:
     is_flag=True,
     help="Enable auto-reload for development",
 )
-def serve(host: str, port: int, reload: bool) -> None:
+@click.option(
+    "--workers",
+    "-w",
+    default=1,
+    type=int,
+    help="Number of worker processes (ignored with --reload)",
+)
+def serve(host: str, port: int, reload: bool, workers: int) -> None:
     """
     Start the HTTP API server.
 
-    Serves the governance decision API.
+    Serves the governance decision API. With the api extra installed
+    (uvicorn[standard]) the server runs on uvloop and httptools.
     """
     try:
         import uvicorn
@@ -241,6 +285,10 @@ def serve(host: str, port: int, reload: bool) -> None:
         host=host,
         port=port,
         reload=reload,
+        workers=None if reload else workers,
+        # "auto" selects uvloop and httptools when installed, else asyncio and h11
+        loop="auto",
+        http="auto",
     )
 
 
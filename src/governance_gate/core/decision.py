@@ -10,15 +10,57 @@ Enhanced with:
 from dataclasses import dataclass, field
 from typing import Any, TYPE_CHECKING, Optional
 from datetime import datetime, timezone
+import itertools
+import os
+import secrets
 import uuid
 
 if TYPE_CHECKING:
     from .types import DecisionAction
 
 
-def generate_trace_id() -> str:
-    """Generate a unique trace identifier."""
-    return str(uuid.uuid4())
+# Sets the RFC 4122 variant bits on the sequence half of a trace ID
+_TRACE_VARIANT = 0x8000000000000000
+
+
+def _new_trace_prefix() -> str:
+    """Return a random 60-bit trace ID prefix in UUID v4 layout."""
+    digits = secrets.token_hex(8)
+    return f"{digits[:8]}-{digits[8:12]}-4{digits[13:]}-"
+
+
+_trace_prefix = _new_trace_prefix()
+_trace_counter = itertools.count()
+
+
+def _reset_trace_ids() -> None:
+    """Give a forked child its own prefix so it cannot repeat the parent's IDs."""
+    global _trace_prefix, _trace_counter
+    _trace_prefix = _new_trace_prefix()
+    _trace_counter = itertools.count()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_trace_ids)
+
+
+def generate_trace_id(strict: bool = False) -> str:
+    """
+    Generate a unique trace identifier.
+
+    IDs are a random per-process prefix plus a sequence number, laid out as
+    a version 4 UUID, so no urandom call is made per decision.
+
+    Args:
+        strict: Return a fully random RFC 4122 uuid4 instead
+
+    Returns:
+        The trace ID string
+    """
+    if strict:
+        return str(uuid.uuid4())
+    sequence = f"{_TRACE_VARIANT | next(_trace_counter):016x}"
+    return f"{_trace_prefix}{sequence[:4]}-{sequence[4:]}"
 
 
 def generate_decision_code(action: "DecisionAction", primary_gate: str, reason_type: str) -> str:
@@ -54,7 +96,7 @@ def generate_decision_code(action: "DecisionAction", primary_gate: str, reason_t
     return f"{gate_prefix}_{action_upper}_{reason_upper}"
 
 
-@dataclass
+@dataclass(slots=True)
 class GateDecision:
     """
     Decision contribution from a single gate.
@@ -79,7 +121,7 @@ class GateDecision:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class Decision:
     """
     Represents a governance decision with enhanced traceability.
@@ -225,7 +267,7 @@ class Decision:
         """Create a Decision from a dictionary."""
         from .types import DecisionAction
 
-        decision = cls(
+        return cls(
             action=DecisionAction(data["action"]),
             rationale=data["rationale"],
             evidence_summary=data.get("evidence_summary", {}),
@@ -233,24 +275,21 @@ class Decision:
             required_steps=data.get("required_steps", []),
             timestamp=data.get("timestamp", datetime.now(timezone.utc).isoformat()),
             gate_contributions=data.get("gate_contributions", {}),
-            policy_version=data.get("policy_version"),
-            policy_name=data.get("policy_name"),
-            decision_code=data.get("decision_code"),
-            final_gate=data.get("final_gate"),
-        )
-
-        # Restore gate_decisions if present
-        if "gate_decisions" in data:
-            for gate_name, gd_dict in data["gate_decisions"].items():
-                decision.gate_decisions[gate_name] = GateDecision(
+            gate_decisions={
+                gate_name: GateDecision(
                     gate_name=gd_dict["gate_name"],
                     suggested_action=gd_dict.get("suggested_action"),
                     rationale=gd_dict["rationale"],
                     config_used=gd_dict.get("config_used"),
                     input_summary=gd_dict.get("input_summary"),
                 )
-
-        return decision
+                for gate_name, gd_dict in data.get("gate_decisions", {}).items()
+            },
+            policy_version=data.get("policy_version"),
+            policy_name=data.get("policy_name"),
+            decision_code=data.get("decision_code"),
+            final_gate=data.get("final_gate"),
+        )
 
 
 # Import DecisionAction at module level to avoid circular import
@@ -3,8 +3,12 @@ Governance pipeline that runs gates and combines their decisions deterministical
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, ClassVar, Hashable, Iterable
 import copy
+import inspect
+import threading
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -12,14 +16,79 @@ if TYPE_CHECKING:
     from governance_gate.policy.evaluator import PolicyEvaluator
 
 
+# Suggested number of memoized gate results for pipelines that opt into caching
+DEFAULT_CACHE_SIZE = 1024
+
+# Records handed to each worker by GovernancePipeline.evaluate_many
+_BATCH_CHUNK_SIZE = 64
+
+# One gate's contribution: (gate name, action, rationale, config_used, input_summary)
+GateResult = tuple[str, "DecisionAction | None", str, "dict[str, Any] | None", "dict[str, Any] | None"]
+
+# Marks a field path that does not resolve, so absent and None values differ in cache keys
+_MISSING = object()
+
+_FIELD_ROOTS = ("intent", "context", "evidence")
+
+
+def _copy_result(result: GateResult) -> GateResult:
+    """Copy a gate result so a decision cannot mutate a cached config or summary."""
+    name, action, rationale, config_used, input_summary = result
+    return (name, action, rationale, copy.deepcopy(config_used), copy.deepcopy(input_summary))
+
+
+def _config_getter(gate: "Gate") -> Callable[["PolicyEvaluator | None"], dict[str, Any]]:
+    """
+    Return gate.get_config_snapshot as a callable taking the policy.
+
+    Overrides written before get_config_snapshot took a policy are called
+    without it.
+    """
+    get_config_snapshot = gate.get_config_snapshot
+    try:
+        inspect.signature(get_config_snapshot).bind(None)
+    except TypeError:
+        return lambda policy: get_config_snapshot()
+    return get_config_snapshot
+
+
+def _compile_field(path: str) -> tuple[int, tuple[str, ...]]:
+    """Split a USED_FIELDS path into (root index, remaining parts)."""
+    root, *parts = path.split(".")
+    return _FIELD_ROOTS.index(root), tuple(parts)
+
+
+def _read_field(current: Any, parts: tuple[str, ...]) -> Any:
+    """Follow path parts through dicts and attributes, like Evidence.get."""
+    for part in parts:
+        if isinstance(current, dict):
+            if part not in current:
+                return _MISSING
+            current = current[part]
+        elif hasattr(current, part):
+            current = getattr(current, part)
+        else:
+            return _MISSING
+
+    return current
+
+
 class Gate(ABC):
     """
     Abstract base class for governance gates.
 
     Each gate evaluates the intent, context, and evidence to determine
     if the action should be modified (overridden) or annotated.
+
+    Gates that declare USED_FIELDS, the dotted paths under "intent.",
+    "context." and "evidence." that evaluate() reads, let the pipeline
+    reuse their results for inputs that agree on those fields. A gate that
+    declares them must depend only on those fields, the policy, and its own
+    settings.
     """
 
+    USED_FIELDS: ClassVar[tuple[str, ...] | None] = None
+
     @property
     @abstractmethod
     def name(self) -> str:
@@ -49,12 +118,15 @@ class Gate(ABC):
         """
         pass
 
-    def get_config_snapshot(self) -> dict[str, Any]:
+    def get_config_snapshot(self, policy: "PolicyEvaluator | None" = None) -> dict[str, Any]:
         """
-        Get the current configuration snapshot of this gate.
+        Get the configuration snapshot of this gate under policy.
 
-        Returns a dictionary of config values that were used during evaluation.
-        This should be called after evaluate() to capture the actual config used.
+        Returns a dictionary of the config values evaluate() uses when given
+        the same policy. The pipeline passes the policy of each evaluation,
+        so implementations should derive the snapshot from their settings and
+        policy rather than from state left behind by evaluate(): one gate can
+        be evaluated concurrently, or by pipelines with different policies.
         """
         # Default implementation - subclasses can override
         return {}
@@ -88,18 +160,43 @@ class GovernancePipeline:
     3. Add annotations regardless of action
     """
 
-    def __init__(self, gates: list[Gate], default_action: "DecisionAction" = None) -> None:
+    def __init__(
+        self,
+        gates: list[Gate],
+        default_action: "DecisionAction" = None,
+        cache_size: int = 0,
+        stop_early: bool = False,
+    ) -> None:
         """
         Initialize the pipeline with a list of gates.
 
         Args:
             gates: List of gates to evaluate in order
             default_action: Default action if no gates override (default: ALLOW)
+            cache_size: Maximum number of memoized gate results; 0 (the default)
+                disables caching. Cached config and input summaries are copied
+                on every hit. Results are not invalidated when a gate's settings
+                change, so call clear_cache() after changing them.
+            stop_early: Skip the gates after one returns STOP. Nothing can override
+                STOP, so the action and final gate are unchanged, but the skipped
+                gates are missing from the decision's gate contributions.
         """
         from governance_gate.core.types import DecisionAction
 
         self.gates = gates
         self.default_action = default_action or DecisionAction.ALLOW
+        self.cache_size = cache_size
+        self.stop_early = stop_early
+        self._cache: OrderedDict[Hashable, tuple[GateResult, ...]] = OrderedDict()
+        # Per-gate results, keyed on (gate, policy, values of that gate's USED_FIELDS)
+        self._gate_cache: OrderedDict[Hashable, GateResult] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # (gates, (compiled union of their USED_FIELDS, each gate's indexes into it) or None)
+        # for the last gate list seen
+        self._cache_fields: tuple[tuple[Gate, ...], Any] = ((), None)
+        # (gates, their bound name/evaluate/get_config_snapshot/get_input_summary)
+        # for the last gate list seen
+        self._gate_calls: tuple[tuple[Gate, ...], tuple[tuple[Any, ...], ...]] = ((), ())
 
     def evaluate(
         self,
@@ -121,7 +218,7 @@ class GovernancePipeline:
             A Decision with the final action, rationale, and evidence summary
         """
         from governance_gate.core.decision import Decision, generate_decision_code
-        from governance_gate.core.types import DecisionAction
+        from governance_gate.core.types import DecisionAction, _run_user_input
 
         # Start with default decision
         current_action = self.default_action
@@ -151,30 +248,32 @@ class GovernancePipeline:
         primary_gate = None
         primary_reason_type = "default"
 
-        # Evaluate each gate in sequence
-        for gate in self.gates:
-            gate_action, gate_rationale = gate.evaluate(intent, context, evidence, policy)
-
-            # Capture traceability info
-            config_used = gate.get_config_snapshot()
-            input_summary = gate.get_input_summary(evidence)
+        # Lower the user input once for every gate in this run, without keeping it afterwards
+        token = _run_user_input.set((intent, intent.user_input_lower()))
+        try:
+            results = self._run_gates(intent, context, evidence, policy)
+        finally:
+            _run_user_input.reset(token)
 
+        # Combine each gate's result in sequence
+        for gate_name, gate_action, gate_rationale, config_used, input_summary in results:
             # Add gate decision with traceability
             decision.add_gate_decision(
-                gate_name=gate.name,
+                gate_name=gate_name,
                 suggested_action=gate_action.value if gate_action else None,
                 rationale=gate_rationale,
-                config_used=config_used if config_used else None,
-                input_summary=input_summary if input_summary else None,
+                config_used=config_used,
+                input_summary=input_summary,
             )
 
             # Override action if gate returned one with higher precedence
             if gate_action is not None:
                 if gate_action.dominates(decision.action):
-                    decision.override(gate_action, gate.name, gate_rationale, config_used, input_summary)
-                    winning_gate = gate.name  # Track the gate that's currently winning
-                    primary_gate = gate.name
-                    primary_reason_type = gate_rationale.split()[0] if gate_rationale else "override"
+                    decision.override(gate_action, gate_name, gate_rationale, config_used, input_summary)
+                    winning_gate = gate_name  # Track the gate that's currently winning
+                    primary_gate = gate_name
+                    # Only the first word is needed; don't split the whole rationale
+                    primary_reason_type = gate_rationale.split(None, 1)[0] if gate_rationale else "override"
 
         # Set final_gate: None for ALLOW, otherwise the winning gate name
         if decision.action != DecisionAction.ALLOW:
@@ -193,6 +292,183 @@ class GovernancePipeline:
 
         return decision
 
+    def evaluate_many(
+        self,
+        records: Iterable[tuple["Intent", "Context", "Evidence"]],
+        policy: "PolicyEvaluator | None" = None,
+        max_workers: int | None = None,
+    ) -> list["Decision"]:
+        """
+        Run all gates for many (intent, context, evidence) records.
+
+        Intended for replay and soak tests. Records go through the same
+        result caches as evaluate(), so repeated inputs in a batch are
+        evaluated once.
+
+        Args:
+            records: Iterable of (intent, context, evidence) tuples
+            policy: Optional policy evaluator applied to every record
+            max_workers: Evaluate on a thread pool of this size when greater
+                than 1; by default records are evaluated serially
+
+        Returns:
+            One Decision per record, in input order
+        """
+        evaluate = self.evaluate
+
+        if max_workers is None or max_workers <= 1:
+            return [evaluate(intent, context, evidence, policy) for intent, context, evidence in records]
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(lambda record: evaluate(*record, policy), records, chunksize=_BATCH_CHUNK_SIZE)
+            )
+
+    def _run_gates(
+        self,
+        intent: "Intent",
+        context: "Context",
+        evidence: "Evidence",
+        policy: "PolicyEvaluator | None",
+    ) -> tuple[GateResult, ...]:
+        """
+        Return every gate's result, reusing memoized results when possible.
+
+        When every gate declares USED_FIELDS, results are memoized in bounded
+        LRU caches: one keyed on the policy, the gates, and the type-tagged
+        values of all their fields, and one per gate keyed on only the fields
+        that gate reads. A request that differs from an earlier one in a field
+        read by a single gate re-evaluates just that gate. Inputs with
+        unhashable field values bypass the caches. Cached results are stored
+        and returned as copies.
+        """
+        if not self.cache_size:
+            return self._evaluate_gates(intent, context, evidence, policy)
+
+        gates = tuple(self.gates)
+        cached_gates, plan = self._cache_fields
+        if gates != cached_gates:
+            if all(gate.USED_FIELDS is not None for gate in gates):
+                paths = list(dict.fromkeys(path for gate in gates for path in gate.USED_FIELDS))
+                plan = (
+                    tuple(_compile_field(path) for path in paths),
+                    tuple(tuple(paths.index(path) for path in gate.USED_FIELDS) for gate in gates),
+                )
+            else:
+                plan = None
+            self._cache_fields = (gates, plan)
+
+        if plan is None:
+            return self._evaluate_gates(intent, context, evidence, policy)
+
+        fields, gate_indexes = plan
+        roots = (intent, context, evidence)
+        values = tuple(
+            (type(value), value)
+            for value in (_read_field(roots[root], parts) for root, parts in fields)
+        )
+        key = (policy, gates, values)
+        try:
+            hash(key)
+        except TypeError:
+            return self._evaluate_gates(intent, context, evidence, policy)
+
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+        if cached is not None:
+            return tuple(_copy_result(result) for result in cached)
+
+        gate_keys = tuple(
+            (gate, policy, tuple(values[index] for index in indexes))
+            for gate, indexes in zip(gates, gate_indexes)
+        )
+        results = self._evaluate_gates(intent, context, evidence, policy, gate_keys)
+
+        with self._cache_lock:
+            self._cache[key] = tuple(_copy_result(result) for result in results)
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+        return results
+
+    def _evaluate_gates(
+        self,
+        intent: "Intent",
+        context: "Context",
+        evidence: "Evidence",
+        policy: "PolicyEvaluator | None",
+        gate_keys: tuple[Hashable, ...] | None = None,
+    ) -> tuple[GateResult, ...]:
+        """
+        Evaluate each gate in sequence and capture its traceability info.
+
+        When gate_keys is given, each gate's result is looked up in, and
+        stored to, the per-gate cache under the matching key.
+        """
+        from governance_gate.core.types import DecisionAction
+
+        results = []
+        stop_early = self.stop_early
+        for position, (name, evaluate, get_config_snapshot, get_input_summary) in enumerate(
+            self._bound_gates()
+        ):
+            result = None
+            if gate_keys is not None:
+                gate_key = gate_keys[position]
+                with self._cache_lock:
+                    result = self._gate_cache.get(gate_key)
+                    if result is not None:
+                        self._gate_cache.move_to_end(gate_key)
+                if result is not None:
+                    result = _copy_result(result)
+
+            if result is None:
+                gate_action, gate_rationale = evaluate(intent, context, evidence, policy)
+                config_used = get_config_snapshot(policy)
+                input_summary = get_input_summary(evidence)
+                result = (
+                    name,
+                    gate_action,
+                    gate_rationale,
+                    config_used if config_used else None,
+                    input_summary if input_summary else None,
+                )
+                if gate_keys is not None:
+                    with self._cache_lock:
+                        self._gate_cache[gate_key] = _copy_result(result)
+                        if len(self._gate_cache) > self.cache_size:
+                            self._gate_cache.popitem(last=False)
+
+            results.append(result)
+            if result[1] is DecisionAction.STOP and stop_early:
+                break
+        return tuple(results)
+
+    def _bound_gates(self) -> tuple[tuple[Any, ...], ...]:
+        """
+        Return each gate's name and bound evaluation methods.
+
+        The tuple is rebuilt only when the gate list changes, so evaluating
+        a fixed pipeline skips the per-gate attribute lookups.
+        """
+        gates = tuple(self.gates)
+        cached_gates, calls = self._gate_calls
+        if gates != cached_gates:
+            calls = tuple(
+                (gate.name, gate.evaluate, _config_getter(gate), gate.get_input_summary)
+                for gate in gates
+            )
+            self._gate_calls = (gates, calls)
+        return calls
+
+    def clear_cache(self) -> None:
+        """Drop all memoized gate results, e.g. after changing a gate's settings."""
+        with self._cache_lock:
+            self._cache.clear()
+            self._gate_cache.clear()
+
     def add_gate(self, gate: Gate) -> None:
         """Add a gate to the end of the pipeline."""
         self.gates.append(gate)
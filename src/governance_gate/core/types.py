@@ -2,6 +2,7 @@
 Core type definitions for the governance gate system.
 """
 
+from contextvars import ContextVar
 from dataclasses import dataclass, field
 from typing import Any
 from enum import Enum
@@ -32,19 +33,23 @@ class DecisionAction(str, Enum):
     @property
     def precedence(self) -> int:
         """Return precedence value (higher = more severe)."""
-        return {
-            DecisionAction.ALLOW: 0,
-            DecisionAction.RESTRICT: 1,
-            DecisionAction.ESCALATE: 2,
-            DecisionAction.STOP: 3,
-        }[self]
+        return _PRECEDENCE[self]
 
     def dominates(self, other: "DecisionAction") -> bool:
         """Return True if this action has higher precedence than other."""
-        return self.precedence > other.precedence
+        return _PRECEDENCE[self] > _PRECEDENCE[other]
 
 
-@dataclass(frozen=True)
+# Built once at import rather than on every precedence lookup
+_PRECEDENCE: dict[DecisionAction, int] = {
+    DecisionAction.ALLOW: 0,
+    DecisionAction.RESTRICT: 1,
+    DecisionAction.ESCALATE: 2,
+    DecisionAction.STOP: 3,
+}
+
+
+@dataclass(frozen=True, slots=True)
 class Intent:
     """
     Represents a recognized user intent.
@@ -63,8 +68,25 @@ class Intent:
         if not 0.0 <= self.confidence <= 1.0:
             raise ValueError(f"Intent confidence must be between 0 and 1, got {self.confidence}")
 
+    def user_input_lower(self) -> str:
+        """
+        Return the lowercased "user_input" parameter ("" if absent).
+
+        Several gates match keywords against the same input during one
+        pipeline run; GovernancePipeline.evaluate lowers it once and the
+        gates share that copy until the run ends.
+        """
+        current = _run_user_input.get()
+        if current is not None and current[0] is self:
+            return current[1]
+        return (self.parameters or {}).get("user_input", "").lower()
 
-@dataclass(frozen=True)
+
+# (intent, lowered user_input) for the pipeline run in progress in this context
+_run_user_input: ContextVar[tuple[Intent, str] | None] = ContextVar("_run_user_input", default=None)
+
+
+@dataclass(frozen=True, slots=True)
 class Context:
     """
     Represents execution context for the intent.
@@ -82,11 +104,14 @@ class Context:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Evidence:
     """
     Represents evidence collected for governance evaluation.
 
+    The dicts are held by reference and never copied, so one Evidence can
+    be shared across evaluations.
+
     Attributes:
         facts: Information about fact verifiability
         rag: Information about retrieval quality
@@ -60,7 +60,14 @@ def build_evidence(
         An Evidence object
     """
     if collector is None:
-        collector = SimpleEvidenceCollector()
+        # Default path: read the namespaces straight from context_data, which is
+        # what SimpleEvidenceCollector does, without the intermediate dict
+        return Evidence(
+            facts=context_data.get("facts", {}),
+            rag=context_data.get("rag", {}),
+            topic=context_data.get("topic", {}),
+            metadata=context_data.get("metadata", {}),
+        )
 
     evidence_data = collector.collect(intent_data, context_data)
 
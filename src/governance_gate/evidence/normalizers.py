@@ -2,9 +2,15 @@
 Evidence normalizers for standardizing evidence formats.
 """
 
+from bisect import bisect_right
 from typing import Any
 
 
+# Freshness bands for day counts: < 7 fresh, < 30 stale, otherwise outdated
+_FRESHNESS_CUTOFFS = (7, 30)
+_FRESHNESS_LABELS = ("fresh", "stale", "outdated")
+
+
 class EvidenceNormalizer:
     """
     Normalizes evidence values to standard types and ranges.
@@ -84,14 +90,7 @@ class EvidenceNormalizer:
         """
         if isinstance(value, int):
             # Assume days
-            if value < 1:
-                return "fresh"
-            elif value < 7:
-                return "fresh"
-            elif value < 30:
-                return "stale"
-            else:
-                return "outdated"
+            return _FRESHNESS_LABELS[bisect_right(_FRESHNESS_CUTOFFS, value)]
 
         if isinstance(value, str):
             value_lower = value.lower()
@@ -2,7 +2,8 @@
 Gate that evaluates whether facts used in the response are verifiable.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -13,6 +14,11 @@ from governance_gate.core.pipeline import Gate
 from governance_gate.core.types import DecisionAction
 
 
+# Fact sources and freshness labels that trigger rules 3 and 4
+UNTRUSTED_SOURCES = frozenset({"unknown", "untrusted", "user_provided"})
+STALE_FRESHNESS = frozenset({"stale", "outdated", "expired"})
+
+
 class FactVerifiabilityGate(Gate):
     """
     Evaluates whether facts required to fulfill the intent are verifiable.
@@ -30,6 +36,15 @@ class FactVerifiabilityGate(Gate):
 
     name = "fact_verifiability"
 
+    USED_FIELDS: ClassVar[tuple[str, ...]] = (
+        "intent.name",
+        "evidence.facts.verifiable",
+        "evidence.facts.verifiable_confidence",
+        "evidence.facts.source",
+        "evidence.facts.freshness",
+        "evidence.facts.requires_realtime",
+    )
+
     def __init__(
         self,
         require_realtime_facts: list[str] | None = None,
@@ -48,6 +63,41 @@ class FactVerifiabilityGate(Gate):
         self.verifiable_threshold = verifiable_threshold
         self.stop_on_unverifiable = stop_on_unverifiable
 
+        # (require_realtime_facts, verifiable_threshold, stop_on_unverifiable) per policy
+        self._resolved_cache: WeakKeyDictionary[
+            "PolicyEvaluator", tuple[frozenset[str], float, bool]
+        ] = WeakKeyDictionary()
+
+    def _defaults(self) -> tuple[frozenset[str], float, bool]:
+        """Return the constructor configuration as a tuple."""
+        return (
+            frozenset(self.require_realtime_facts),
+            self.verifiable_threshold,
+            self.stop_on_unverifiable,
+        )
+
+    def _resolve(self, policy: "PolicyEvaluator | None") -> tuple[frozenset[str], float, bool]:
+        """
+        Resolve the effective configuration for a policy.
+
+        Policy values override the constructor defaults. The result is cached
+        per policy evaluator, so the gate config is read once per policy
+        rather than on every evaluation.
+        """
+        if not policy:
+            return self._defaults()
+
+        resolved = self._resolved_cache.get(policy)
+        if resolved is None:
+            policy_config = policy.get_gate_config(self.name)
+            resolved = (
+                frozenset(policy_config.get("require_realtime_facts", self.require_realtime_facts)),
+                policy_config.get("verifiable_threshold", self.verifiable_threshold),
+                policy_config.get("stop_on_unverifiable", self.stop_on_unverifiable),
+            )
+            self._resolved_cache[policy] = resolved
+        return resolved
+
     def evaluate(
         self,
         intent: "Intent",
@@ -61,36 +111,29 @@ class FactVerifiabilityGate(Gate):
         Returns:
             (DecisionAction, rationale) - Action is None if no override needed
         """
-        # Check if policy overrides defaults
-        if policy:
-            policy_config = policy.get_gate_config(self.name)
-            if policy_config:
-                self.require_realtime_facts = set(
-                    policy_config.get("require_realtime_facts", self.require_realtime_facts)
-                )
-                self.verifiable_threshold = policy_config.get(
-                    "verifiable_threshold", self.verifiable_threshold
-                )
-                self.stop_on_unverifiable = policy_config.get(
-                    "stop_on_unverifiable", self.stop_on_unverifiable
-                )
+        # Resolve policy overrides without mutating the gate's own settings
+        config = self._resolve(policy)
+        require_realtime_facts, verifiable_threshold, stop_on_unverifiable = config
+
+        # Every check reads the facts namespace; fetch it once
+        facts = evidence.facts if isinstance(evidence.facts, dict) else {}
 
         # Get fact verifiability from evidence
-        verifiable = evidence.get("facts.verifiable", True)
-        verifiable_confidence = evidence.get("facts.verifiable_confidence", 1.0)
+        verifiable = facts.get("verifiable", True)
+        verifiable_confidence = facts.get("verifiable_confidence", 1.0)
 
         # Check if this intent requires real-time facts
-        needs_realtime = intent.name in self.require_realtime_facts
-        is_realtime_dependent = evidence.get("facts.requires_realtime", needs_realtime)
+        needs_realtime = intent.name in require_realtime_facts
+        is_realtime_dependent = facts.get("requires_realtime", needs_realtime)
 
         # Get fact source info
-        fact_source = evidence.get("facts.source", "unknown")
-        fact_freshness = evidence.get("facts.freshness", "unknown")
+        fact_source = facts.get("source", "unknown")
+        fact_freshness = facts.get("freshness", "unknown")
 
         # Rule 1: Facts are explicitly not verifiable
         if verifiable is False:
             if is_realtime_dependent:
-                action = DecisionAction.STOP if self.stop_on_unverifiable else DecisionAction.RESTRICT
+                action = DecisionAction.STOP if stop_on_unverifiable else DecisionAction.RESTRICT
                 return (
                     action,
                     f"Intent '{intent.name}' requires real-time facts but facts are not verifiable (source: {fact_source}, freshness: {fact_freshness})",
@@ -102,20 +145,20 @@ class FactVerifiabilityGate(Gate):
                 )
 
         # Rule 2: Facts have low verifiability confidence
-        if verifiable_confidence < self.verifiable_threshold:
+        if verifiable_confidence < verifiable_threshold:
             if is_realtime_dependent:
                 return (
                     DecisionAction.RESTRICT,
-                    f"Intent '{intent.name}' requires high-confidence facts, but confidence is {verifiable_confidence:.2f} (threshold: {self.verifiable_threshold:.2f})",
+                    f"Intent '{intent.name}' requires high-confidence facts, but confidence is {verifiable_confidence:.2f} (threshold: {verifiable_threshold:.2f})",
                 )
             else:
                 return (
                     None,
-                    f"Fact verifiability confidence is {verifiable_confidence:.2f} (below threshold {self.verifiable_threshold:.2f})",
+                    f"Fact verifiability confidence is {verifiable_confidence:.2f} (below threshold {verifiable_threshold:.2f})",
                 )
 
         # Rule 3: Facts are from untrusted sources
-        if fact_source in ["unknown", "untrusted", "user_provided"]:
+        if isinstance(fact_source, str) and fact_source in UNTRUSTED_SOURCES:
             if is_realtime_dependent:
                 return (
                     DecisionAction.RESTRICT,
@@ -128,7 +171,7 @@ class FactVerifiabilityGate(Gate):
                 )
 
         # Rule 4: Facts may be stale
-        if fact_freshness in ["stale", "outdated", "expired"]:
+        if isinstance(fact_freshness, str) and fact_freshness in STALE_FRESHNESS:
             return (
                 DecisionAction.RESTRICT,
                 f"Facts may be stale (freshness: {fact_freshness}) - recommend refresh",
@@ -140,12 +183,13 @@ class FactVerifiabilityGate(Gate):
             f"Facts are verifiable (confidence: {verifiable_confidence:.2f}, source: {fact_source})",
         )
 
-    def get_config_snapshot(self) -> dict[str, Any]:
-        """Get the configuration snapshot of this gate."""
+    def get_config_snapshot(self, policy: "PolicyEvaluator | None" = None) -> dict[str, Any]:
+        """Get the configuration snapshot evaluate() uses under policy."""
+        require_realtime_facts, verifiable_threshold, stop_on_unverifiable = self._resolve(policy)
         return {
-            "verifiable_threshold": self.verifiable_threshold,
-            "require_realtime_facts": list(self.require_realtime_facts),
-            "stop_on_unverifiable": self.stop_on_unverifiable,
+            "verifiable_threshold": verifiable_threshold,
+            "require_realtime_facts": list(require_realtime_facts),
+            "stop_on_unverifiable": stop_on_unverifiable,
         }
 
     def get_input_summary(self, evidence: "Evidence") -> dict[str, Any]:
@@ -153,7 +197,7 @@ class FactVerifiabilityGate(Gate):
         # This gate examines the facts namespace
         return {
             "facts": {
-                "verifiable": evidence.facts,
+                "verifiable": evidence.facts.get("verifiable"),
                 "verifiable_confidence": evidence.facts.get("verifiable_confidence"),
                 "source": evidence.facts.get("source"),
                 "freshness": evidence.facts.get("freshness"),
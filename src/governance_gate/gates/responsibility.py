@@ -2,7 +2,8 @@
 Gate that evaluates whether responsibility boundaries are respected.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -13,6 +14,12 @@ from governance_gate.core.pipeline import Gate
 from governance_gate.core.types import DecisionAction
 
 
+_Config = tuple[frozenset[str], frozenset[str], frozenset[str], bool]
+
+# Substrings of lowercased user input that suggest a compensation/financial request
+COMPENSATION_KEYWORDS: tuple[str, ...] = ("compensat", "refund", "credit", "discount", "reimburse")
+
+
 class ResponsibilityGate(Gate):
     """
     Evaluates whether the request crosses responsibility boundaries.
@@ -32,6 +39,15 @@ class ResponsibilityGate(Gate):
 
     name = "responsibility"
 
+    USED_FIELDS: ClassVar[tuple[str, ...]] = (
+        "intent.name",
+        "intent.parameters.user_input",
+        "evidence.topic.has_financial_impact",
+        "evidence.topic.requires_authority",
+        "evidence.topic.is_irreversible",
+        "evidence.topic.is_sensitive",
+    )
+
     def __init__(
         self,
         financial_intents: list[str] | None = None,
@@ -68,6 +84,41 @@ class ResponsibilityGate(Gate):
         ])
         self.stop_on_sensitive = stop_on_sensitive
 
+        # (financial_intents, authority_intents, sensitive_intents, stop_on_sensitive) per policy
+        self._resolved_cache: WeakKeyDictionary["PolicyEvaluator", _Config] = WeakKeyDictionary()
+
+    def _defaults(self) -> _Config:
+        """Return the constructor configuration as a tuple."""
+        return (
+            frozenset(self.financial_intents),
+            frozenset(self.authority_intents),
+            frozenset(self.sensitive_intents),
+            self.stop_on_sensitive,
+        )
+
+    def _resolve(self, policy: "PolicyEvaluator | None") -> _Config:
+        """
+        Resolve the effective configuration for a policy.
+
+        Policy values override the constructor defaults. The result is cached
+        per policy evaluator, so the gate config is read once per policy
+        rather than on every evaluation.
+        """
+        if not policy:
+            return self._defaults()
+
+        resolved = self._resolved_cache.get(policy)
+        if resolved is None:
+            policy_config = policy.get_gate_config(self.name)
+            resolved = (
+                frozenset(policy_config.get("financial_intents", self.financial_intents)),
+                frozenset(policy_config.get("authority_intents", self.authority_intents)),
+                frozenset(policy_config.get("sensitive_intents", self.sensitive_intents)),
+                policy_config.get("stop_on_sensitive", self.stop_on_sensitive),
+            )
+            self._resolved_cache[policy] = resolved
+        return resolved
+
     def evaluate(
         self,
         intent: "Intent",
@@ -81,32 +132,20 @@ class ResponsibilityGate(Gate):
         Returns:
             (DecisionAction, rationale) - Action is None if no override needed
         """
-        # Check if policy overrides defaults
-        if policy:
-            policy_config = policy.get_gate_config(self.name)
-            if policy_config:
-                self.financial_intents = set(
-                    policy_config.get("financial_intents", list(self.financial_intents))
-                )
-                self.authority_intents = set(
-                    policy_config.get("authority_intents", list(self.authority_intents))
-                )
-                self.sensitive_intents = set(
-                    policy_config.get("sensitive_intents", list(self.sensitive_intents))
-                )
-                self.stop_on_sensitive = policy_config.get(
-                    "stop_on_sensitive", self.stop_on_sensitive
-                )
-
-        # Check evidence flags
-        has_financial_impact = evidence.get("topic.has_financial_impact", False)
-        requires_authority = evidence.get("topic.requires_authority", False)
-        is_irreversible = evidence.get("topic.is_irreversible", False)
-        is_sensitive = evidence.get("topic.is_sensitive", False)
+        # Resolve policy overrides without mutating the gate's own settings
+        config = self._resolve(policy)
+        financial_intents, authority_intents, sensitive_intents, stop_on_sensitive = config
+
+        # Check evidence flags, read from the topic namespace fetched once
+        topic = evidence.topic if isinstance(evidence.topic, dict) else {}
+        has_financial_impact = topic.get("has_financial_impact", False)
+        requires_authority = topic.get("requires_authority", False)
+        is_irreversible = topic.get("is_irreversible", False)
+        is_sensitive = topic.get("is_sensitive", False)
 
         # Rule 1: Financial impact
         if (
-            intent.name in self.financial_intents
+            intent.name in financial_intents
             or has_financial_impact
         ):
             return (
@@ -116,7 +155,7 @@ class ResponsibilityGate(Gate):
 
         # Rule 2: Requires authority/commitment
         if (
-            intent.name in self.authority_intents
+            intent.name in authority_intents
             or requires_authority
         ):
             return (
@@ -133,21 +172,19 @@ class ResponsibilityGate(Gate):
 
         # Rule 4: Sensitive topic
         if (
-            intent.name in self.sensitive_intents
+            intent.name in sensitive_intents
             or is_sensitive
         ):
-            action = DecisionAction.STOP if self.stop_on_sensitive else DecisionAction.ESCALATE
+            action = DecisionAction.STOP if stop_on_sensitive else DecisionAction.ESCALATE
             return (
                 action,
                 f"Intent '{intent.name}' involves sensitive topic - outside autonomous scope",
             )
 
         # Check for compensation keywords in parameters
-        params = intent.parameters or {}
-        user_input = params.get("user_input", "").lower()
-        compensation_keywords = ["compensat", "refund", "credit", "discount", "reimburse"]
+        user_input = intent.user_input_lower()
 
-        if any(keyword in user_input for keyword in compensation_keywords):
+        if any(keyword in user_input for keyword in COMPENSATION_KEYWORDS):
             return (
                 DecisionAction.ESCALATE,
                 "User input suggests compensation/financial request - requires human review",
@@ -159,13 +196,14 @@ class ResponsibilityGate(Gate):
             f"Intent '{intent.name}' is within responsibility boundaries",
         )
 
-    def get_config_snapshot(self) -> dict[str, Any]:
-        """Get the configuration snapshot of this gate."""
+    def get_config_snapshot(self, policy: "PolicyEvaluator | None" = None) -> dict[str, Any]:
+        """Get the configuration snapshot evaluate() uses under policy."""
+        financial_intents, authority_intents, sensitive_intents, stop_on_sensitive = self._resolve(policy)
         return {
-            "financial_intents": list(self.financial_intents),
-            "authority_intents": list(self.authority_intents),
-            "sensitive_intents": list(self.sensitive_intents),
-            "stop_on_sensitive": self.stop_on_sensitive,
+            "financial_intents": list(financial_intents),
+            "authority_intents": list(authority_intents),
+            "sensitive_intents": list(sensitive_intents),
+            "stop_on_sensitive": stop_on_sensitive,
         }
 
     def get_input_summary(self, evidence: "Evidence") -> dict[str, Any]:
@@ -10,7 +10,8 @@ This gate handles the most severe cases that should result in STOP decisions:
 These cases should immediately STOP execution and refuse the request.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -22,7 +23,7 @@ from governance_gate.core.types import DecisionAction
 
 
 # Keywords and patterns that trigger STOP
-FRAUD_KEYWORDS = [
+FRAUD_KEYWORDS: frozenset[str] = frozenset({
     "bypass",
     "credit card generator",
     "card number generator",
@@ -36,9 +37,9 @@ FRAUD_KEYWORDS = [
     "hack payment",
     "payment system",
     "get services for free",
-]
+})
 
-ILLEGAL_CONTENT_KEYWORDS = [
+ILLEGAL_CONTENT_KEYWORDS: frozenset[str] = frozenset({
     "make bomb",
     "how to make explosive",
     "drug manufacturing",
@@ -53,9 +54,9 @@ ILLEGAL_CONTENT_KEYWORDS = [
     "without id",
     "buy cigarettes",
     "age restricted",
-]
+})
 
-SECURITY_ATTACK_KEYWORDS = [
+SECURITY_ATTACK_KEYWORDS: frozenset[str] = frozenset({
     "sql injection",
     "xss attack",
     "ddos attack",
@@ -63,7 +64,50 @@ SECURITY_ATTACK_KEYWORDS = [
     "exploit vulnerability",
     "brute force",
     "inject code",
-]
+})
+
+
+EncodedKeywords = tuple[tuple[str, bytes], ...]
+
+# (first characters, fraud, illegal, security) lookup structures for the keyword scan
+KeywordIndex = tuple[frozenset[str], EncodedKeywords, EncodedKeywords, EncodedKeywords]
+
+# (fraud keywords, illegal keywords, stop_on_sensitive_stop, keyword index)
+_Config = tuple[frozenset[str], frozenset[str], bool, KeywordIndex]
+
+
+def _encode_keywords(keywords: frozenset[str]) -> EncodedKeywords:
+    """Pair each keyword with its UTF-8 encoding for byte-level scanning."""
+    return tuple((keyword, keyword.encode("utf-8", "surrogatepass")) for keyword in keywords)
+
+
+def _build_keyword_index(
+    fraud_keywords: frozenset[str],
+    illegal_keywords: frozenset[str],
+    security_keywords: frozenset[str],
+) -> KeywordIndex:
+    """
+    Build the lookup structures used by the keyword scan.
+
+    - A first-character prefilter: every keyword match must start with one
+      of these characters, so an input sharing none of them cannot match
+      and the full scan can be skipped.
+    - UTF-8 encoded copies of each keyword set, so the scan runs
+      bytes.find over an encoded input buffer. UTF-8 is self-synchronizing,
+      so byte-level substring matches are exactly text-level matches.
+    """
+    first_chars = frozenset(
+        keyword[0]
+        for keywords in (fraud_keywords, illegal_keywords, security_keywords)
+        for keyword in keywords
+        if keyword
+    )
+    return (
+        first_chars,
+        _encode_keywords(fraud_keywords),
+        _encode_keywords(illegal_keywords),
+        _encode_keywords(security_keywords),
+    )
 
 
 class SafetyGate(Gate):
@@ -84,6 +128,13 @@ class SafetyGate(Gate):
 
     name = "safety"
 
+    USED_FIELDS: ClassVar[tuple[str, ...]] = (
+        "intent.name",
+        "intent.parameters.user_input",
+        "evidence.topic.harm_risk",
+        "evidence.topic.is_sensitive",
+    )
+
     def __init__(
         self,
         additional_fraud_keywords: list[str] | None = None,
@@ -98,10 +149,64 @@ class SafetyGate(Gate):
             additional_illegal_keywords: Additional illegal content keywords to detect
             stop_on_sensitive_stop: Whether to STOP on sensitive topics (extreme cases only)
         """
-        self.fraud_keywords = set(FRAUD_KEYWORDS + (additional_fraud_keywords or []))
-        self.illegal_keywords = set(ILLEGAL_CONTENT_KEYWORDS + (additional_illegal_keywords or []))
-        self.security_keywords = set(SECURITY_ATTACK_KEYWORDS)
+        # Share the module-level sets when no extra keywords are supplied
+        self.fraud_keywords = (
+            FRAUD_KEYWORDS | frozenset(additional_fraud_keywords)
+            if additional_fraud_keywords
+            else FRAUD_KEYWORDS
+        )
+        self.illegal_keywords = (
+            ILLEGAL_CONTENT_KEYWORDS | frozenset(additional_illegal_keywords)
+            if additional_illegal_keywords
+            else ILLEGAL_CONTENT_KEYWORDS
+        )
+        self.security_keywords = SECURITY_ATTACK_KEYWORDS
         self.stop_on_sensitive_stop = stop_on_sensitive_stop
+        self._keyword_index = _build_keyword_index(
+            self.fraud_keywords, self.illegal_keywords, self.security_keywords
+        )
+
+        # Resolved keywords, flags and keyword index per policy
+        self._resolved_cache: WeakKeyDictionary["PolicyEvaluator", _Config] = WeakKeyDictionary()
+
+    def _defaults(self) -> _Config:
+        """Return the constructor configuration as a tuple."""
+        return (
+            self.fraud_keywords,
+            self.illegal_keywords,
+            self.stop_on_sensitive_stop,
+            self._keyword_index,
+        )
+
+    def _resolve(self, policy: "PolicyEvaluator | None") -> _Config:
+        """
+        Resolve the effective configuration for a policy.
+
+        Policy keywords are added to the constructor keywords and the keyword
+        index is built for the combined sets. The result is cached per policy
+        evaluator, so the index is rebuilt once per policy rather than on
+        every evaluation.
+        """
+        if not policy:
+            return self._defaults()
+
+        resolved = self._resolved_cache.get(policy)
+        if resolved is None:
+            policy_config = policy.get_gate_config(self.name)
+            fraud_keywords = self.fraud_keywords | frozenset(
+                policy_config.get("additional_fraud_keywords", [])
+            )
+            illegal_keywords = self.illegal_keywords | frozenset(
+                policy_config.get("additional_illegal_keywords", [])
+            )
+            resolved = (
+                fraud_keywords,
+                illegal_keywords,
+                policy_config.get("stop_on_sensitive_stop", self.stop_on_sensitive_stop),
+                _build_keyword_index(fraud_keywords, illegal_keywords, self.security_keywords),
+            )
+            self._resolved_cache[policy] = resolved
+        return resolved
 
     def evaluate(
         self,
@@ -116,47 +221,24 @@ class SafetyGate(Gate):
         Returns:
             (DecisionAction, rationale) - Action is None if no override needed
         """
-        # Check if policy overrides defaults
-        if policy:
-            policy_config = policy.get_gate_config(self.name)
-            if policy_config:
-                additional_fraud = policy_config.get("additional_fraud_keywords", [])
-                additional_illegal = policy_config.get("additional_illegal_keywords", [])
-                self.fraud_keywords.update(additional_fraud)
-                self.illegal_keywords.update(additional_illegal)
-                self.stop_on_sensitive_stop = policy_config.get(
-                    "stop_on_sensitive_stop", self.stop_on_sensitive_stop
-                )
+        # Resolve policy overrides without mutating the gate's own settings
+        config = self._resolve(policy)
+        _, _, stop_on_sensitive_stop, keyword_index = config
 
         # Get user input for keyword checking
-        user_input = intent.parameters.get("user_input", "").lower()
-
-        # Rule 1: Fraud and payment bypass
-        for keyword in self.fraud_keywords:
-            if keyword in user_input:
-                return (
-                    DecisionAction.STOP,
-                    f"Fraud request detected: '{keyword}' - Refusing to process payment bypass/fraud attempt",
-                )
-
-        # Rule 2: Illegal content
-        for keyword in self.illegal_keywords:
-            if keyword in user_input:
-                return (
-                    DecisionAction.STOP,
-                    f"Illegal content request detected: '{keyword}' - Refusing to provide illegal/information",
-                )
+        user_input = intent.user_input_lower()
 
-        # Rule 3: Security attacks
-        for keyword in self.security_keywords:
-            if keyword in user_input:
-                return (
-                    DecisionAction.STOP,
-                    f"Security attack detected: '{keyword}' - Refusing to process security request",
-                )
+        # Rules 1-3: Keyword scan, skipped when no keyword can start in the input
+        if not keyword_index[0].isdisjoint(user_input):
+            keyword_hit = self._scan_keywords(
+                user_input.encode("utf-8", "surrogatepass"), keyword_index
+            )
+            if keyword_hit is not None:
+                return keyword_hit
 
         # Rule 4: Check evidence for explicit safety flags
-        harm_risk = evidence.get("topic.harm_risk", False)
+        topic = evidence.topic if isinstance(evidence.topic, dict) else {}
+        harm_risk = topic.get("harm_risk", False)
         if harm_risk is True:
             # Check if it's fraud-related or illegal-related based on intent
             intent_name = intent.name.lower()
@@ -177,8 +259,8 @@ class SafetyGate(Gate):
                 )
 
         # Rule 5: Extreme sensitive topics (only if configured)
-        if self.stop_on_sensitive_stop:
-            is_sensitive = evidence.get("topic.is_sensitive", False)
+        if stop_on_sensitive_stop:
+            is_sensitive = topic.get("is_sensitive", False)
             if is_sensitive:
                 return (
                     DecisionAction.STOP,
@@ -191,13 +273,52 @@ class SafetyGate(Gate):
             f"No safety risks detected for intent '{intent.name}'",
         )
 
-    def get_config_snapshot(self) -> dict[str, Any]:
-        """Get the configuration snapshot of this gate."""
+    @staticmethod
+    def _scan_keywords(
+        user_input: bytes, keyword_index: KeywordIndex
+    ) -> tuple["DecisionAction", str] | None:
+        """
+        Scan the encoded, lowercased user input for fraud, illegal, and security keywords.
+
+        Returns:
+            (DecisionAction.STOP, rationale) for the first match, or None
+        """
+        _, fraud_bytes, illegal_bytes, security_bytes = keyword_index
+
+        # Rule 1: Fraud and payment bypass
+        for keyword, encoded in fraud_bytes:
+            if user_input.find(encoded) >= 0:
+                return (
+                    DecisionAction.STOP,
+                    f"Fraud request detected: '{keyword}' - Refusing to process payment bypass/fraud attempt",
+                )
+
+        # Rule 2: Illegal content
+        for keyword, encoded in illegal_bytes:
+            if user_input.find(encoded) >= 0:
+                return (
+                    DecisionAction.STOP,
+                    f"Illegal content request detected: '{keyword}' - Refusing to provide illegal/information",
+                )
+
+        # Rule 3: Security attacks
+        for keyword, encoded in security_bytes:
+            if user_input.find(encoded) >= 0:
+                return (
+                    DecisionAction.STOP,
+                    f"Security attack detected: '{keyword}' - Refusing to process security request",
+                )
+
+        return None
+
+    def get_config_snapshot(self, policy: "PolicyEvaluator | None" = None) -> dict[str, Any]:
+        """Get the configuration snapshot evaluate() uses under policy."""
+        fraud_keywords, illegal_keywords, stop_on_sensitive_stop, _ = self._resolve(policy)
         return {
-            "fraud_keywords_count": len(self.fraud_keywords),
-            "illegal_keywords_count": len(self.illegal_keywords),
+            "fraud_keywords_count": len(fraud_keywords),
+            "illegal_keywords_count": len(illegal_keywords),
             "security_keywords_count": len(self.security_keywords),
-            "stop_on_sensitive_stop": self.stop_on_sensitive_stop,
+            "stop_on_sensitive_stop": stop_on_sensitive_stop,
         }
 
     def get_input_summary(self, evidence: "Evidence") -> dict[str, Any]:
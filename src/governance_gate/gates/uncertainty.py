@@ -2,7 +2,8 @@
 Gate that evaluates whether uncertainty is within acceptable bounds.
 """
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, ClassVar
+from weakref import WeakKeyDictionary
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -31,6 +32,18 @@ class UncertaintyGate(Gate):
 
     name = "uncertainty"
 
+    USED_FIELDS: ClassVar[tuple[str, ...]] = (
+        "evidence.rag.confidence",
+        "evidence.rag.source",
+        "evidence.rag.has_conflicts",
+        "evidence.rag.conflict_count",
+        "evidence.rag.kb_version",
+        "evidence.rag.kb_age_days",
+        "evidence.rag.tool_disagreement",
+        "evidence.rag.coverage",
+        "evidence.rag.coverage_threshold",
+    )
+
     def __init__(
         self,
         confidence_threshold: float = 0.6,
@@ -49,6 +62,37 @@ class UncertaintyGate(Gate):
         self.stop_on_conflict = stop_on_conflict
         self.outdated_version_days = outdated_version_days
 
+        # (confidence_threshold, stop_on_conflict, outdated_version_days) per policy
+        self._resolved_cache: WeakKeyDictionary["PolicyEvaluator", tuple[float, bool, int]] = (
+            WeakKeyDictionary()
+        )
+
+    def _defaults(self) -> tuple[float, bool, int]:
+        """Return the constructor configuration as a tuple."""
+        return (self.confidence_threshold, self.stop_on_conflict, self.outdated_version_days)
+
+    def _resolve(self, policy: "PolicyEvaluator | None") -> tuple[float, bool, int]:
+        """
+        Resolve the effective configuration for a policy.
+
+        Policy values override the constructor defaults. The result is cached
+        per policy evaluator, so the gate config is read once per policy
+        rather than on every evaluation.
+        """
+        if not policy:
+            return self._defaults()
+
+        resolved = self._resolved_cache.get(policy)
+        if resolved is None:
+            policy_config = policy.get_gate_config(self.name)
+            resolved = (
+                policy_config.get("confidence_threshold", self.confidence_threshold),
+                policy_config.get("stop_on_conflict", self.stop_on_conflict),
+                policy_config.get("outdated_version_days", self.outdated_version_days),
+            )
+            self._resolved_cache[policy] = resolved
+        return resolved
+
     def evaluate(
         self,
         intent: "Intent",
@@ -62,54 +106,47 @@ class UncertaintyGate(Gate):
         Returns:
             (DecisionAction, rationale) - Action is None if no override needed
         """
-        # Check if policy overrides defaults
-        if policy:
-            policy_config = policy.get_gate_config(self.name)
-            if policy_config:
-                self.confidence_threshold = policy_config.get(
-                    "confidence_threshold", self.confidence_threshold
-                )
-                self.stop_on_conflict = policy_config.get(
-                    "stop_on_conflict", self.stop_on_conflict
-                )
-                self.outdated_version_days = policy_config.get(
-                    "outdated_version_days", self.outdated_version_days
-                )
+        # Resolve policy overrides without mutating the gate's own settings
+        config = self._resolve(policy)
+        confidence_threshold, stop_on_conflict, outdated_version_days = config
+
+        # Every check reads the rag namespace; fetch it once
+        rag = evidence.rag if isinstance(evidence.rag, dict) else {}
 
         # Get RAG confidence from evidence
-        rag_confidence = evidence.get("rag.confidence", 1.0)
-        rag_source = evidence.get("rag.source", "unknown")
+        rag_confidence = rag.get("confidence", 1.0)
+        rag_source = rag.get("source", "unknown")
 
         # Rule 1: Low RAG confidence
-        if rag_confidence < self.confidence_threshold:
+        if rag_confidence < confidence_threshold:
             return (
                 DecisionAction.RESTRICT,
-                f"Retrieval confidence {rag_confidence:.2f} is below threshold {self.confidence_threshold:.2f} (source: {rag_source})",
+                f"Retrieval confidence {rag_confidence:.2f} is below threshold {confidence_threshold:.2f} (source: {rag_source})",
             )
 
         # Check for conflicting results
-        has_conflicts = evidence.get("rag.has_conflicts", False)
-        conflict_count = evidence.get("rag.conflict_count", 0)
+        has_conflicts = rag.get("has_conflicts", False)
+        conflict_count = rag.get("conflict_count", 0)
 
         if has_conflicts or conflict_count > 0:
-            action = DecisionAction.STOP if self.stop_on_conflict else DecisionAction.RESTRICT
+            action = DecisionAction.STOP if stop_on_conflict else DecisionAction.RESTRICT
             return (
                 action,
                 f"Retrieval has {conflict_count} conflicting results - cannot determine correct answer",
             )
 
         # Check knowledge version
-        kb_version = evidence.get("rag.kb_version", "unknown")
-        kb_age_days = evidence.get("rag.kb_age_days", 0)
+        kb_version = rag.get("kb_version", "unknown")
+        kb_age_days = rag.get("kb_age_days", 0)
 
-        if kb_age_days > self.outdated_version_days:
+        if kb_age_days > outdated_version_days:
             return (
                 DecisionAction.RESTRICT,
-                f"Knowledge base version {kb_version} is {kb_age_days} days old (outdated threshold: {self.outdated_version_days} days)",
+                f"Knowledge base version {kb_version} is {kb_age_days} days old (outdated threshold: {outdated_version_days} days)",
             )
 
         # Check for tool disagreement
-        tool_disagreement = evidence.get("rag.tool_disagreement", False)
+        tool_disagreement = rag.get("tool_disagreement", False)
         if tool_disagreement:
             return (
                 DecisionAction.ESCALATE,
@@ -117,8 +154,8 @@ class UncertaintyGate(Gate):
             )
 
         # Check retrieval coverage
-        retrieval_coverage = evidence.get("rag.coverage", 1.0)
-        coverage_threshold = evidence.get("rag.coverage_threshold", 0.8)
+        retrieval_coverage = rag.get("coverage", 1.0)
+        coverage_threshold = rag.get("coverage_threshold", 0.8)
 
         if retrieval_coverage < coverage_threshold:
             return (
@@ -132,12 +169,13 @@ class UncertaintyGate(Gate):
             f"Uncertainty is acceptable (confidence: {rag_confidence:.2f}, coverage: {retrieval_coverage:.2f})",
         )
 
-    def get_config_snapshot(self) -> dict[str, Any]:
-        """Get the configuration snapshot of this gate."""
+    def get_config_snapshot(self, policy: "PolicyEvaluator | None" = None) -> dict[str, Any]:
+        """Get the configuration snapshot evaluate() uses under policy."""
+        confidence_threshold, stop_on_conflict, outdated_version_days = self._resolve(policy)
         return {
-            "confidence_threshold": self.confidence_threshold,
-            "stop_on_conflict": self.stop_on_conflict,
-            "outdated_version_days": self.outdated_version_days,
+            "confidence_threshold": confidence_threshold,
+            "stop_on_conflict": stop_on_conflict,
+            "outdated_version_days": outdated_version_days,
         }
 
     def get_input_summary(self, evidence: "Evidence") -> dict[str, Any]:
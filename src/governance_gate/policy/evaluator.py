@@ -2,7 +2,14 @@
 Policy evaluator that matches conditions against context.
 """
 
-from typing import Any, TYPE_CHECKING
+import heapq
+import re
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import attrgetter, ge, gt, le, lt
+from typing import Any, Callable, Hashable, Iterable, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
@@ -10,6 +17,518 @@ if TYPE_CHECKING:
 from governance_gate.core.types import DecisionAction
 
 
+Predicate = Callable[[Any], bool]
+
+# Suggested number of memoized evaluation results for evaluators that opt
+# into caching
+DEFAULT_CACHE_SIZE = 1024
+
+# Records handed to each worker by PolicyEvaluator.evaluate_many
+_BATCH_CHUNK_SIZE = 64
+
+# Equality-tested fields used to bucket rules, most selective first
+_INDEXED_FIELDS = ("intent.name", "context.channel")
+
+
+def _freeze(value: Any) -> Hashable:
+    """
+    Convert an evaluation input into a canonical hashable key.
+
+    Values are tagged with their type so inputs that compare equal but match
+    differently (e.g. True vs 1 under is_true) never share a cache entry.
+
+    Raises:
+        TypeError: If the value contains something unhashable
+    """
+    if isinstance(value, dict):
+        return (dict, frozenset((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_freeze(v) for v in value))
+    hash(value)
+    return (type(value), value)
+
+
+def _walk(context: dict[str, Any], parts: tuple[str, ...]) -> Any:
+    """
+    Get a value from the evaluation context by following pre-split path parts.
+
+    The evaluation context is all dictionaries, so traversal is dict-only:
+    a path through a non-dict value resolves to None rather than probing
+    attributes.
+    """
+    current: Any = context
+
+    for part in parts:
+        if not isinstance(current, dict):
+            return None
+        current = current.get(part)
+        if current is None:
+            return None
+
+    return current
+
+
+@lru_cache(maxsize=256)
+def _compile_re(pattern: str) -> re.Pattern[str]:
+    """Compile a `matches` pattern, shared across rules and evaluators."""
+    return re.compile(pattern)
+
+
+def _never(value: Any) -> bool:
+    """Predicate for conditions that can never match (e.g. unknown operators)."""
+    return False
+
+
+# ============================================================================
+# Operator factories
+#
+# Each factory receives the expected value from the policy and returns a
+# predicate over the runtime value. Operator dispatch and expected-value
+# checks happen once, when the rule is compiled.
+# ============================================================================
+
+def _op_equals(expected: Any) -> Predicate:
+    return lambda value: value == expected
+
+
+def _op_not_equals(expected: Any) -> Predicate:
+    return lambda value: value != expected
+
+
+def _membership(expected: list[Any]) -> Predicate:
+    """
+    Build an O(1) membership test against an expected list.
+
+    The list is frozen into a frozenset when its items are hashable. Runtime
+    values that are unhashable (e.g. lists) fall back to a scan of the
+    original list, so results match plain `value in expected`.
+    """
+    try:
+        expected_set = frozenset(expected)
+    except TypeError:
+        return expected.__contains__
+
+    def member(value: Any) -> bool:
+        try:
+            return value in expected_set
+        except TypeError:
+            return value in expected
+
+    return member
+
+
+def _op_in(expected: Any) -> Predicate:
+    if not isinstance(expected, list):
+        return _never
+    return _membership(expected)
+
+
+def _op_not_in(expected: Any) -> Predicate:
+    if not isinstance(expected, list):
+        return lambda value: True
+    member = _membership(expected)
+    return lambda value: not member(value)
+
+
+def _op_contains(expected: Any) -> Predicate:
+    if isinstance(expected, str):
+        def contains(value: Any) -> bool:
+            return isinstance(value, (str, list)) and expected in value
+    elif isinstance(expected, (int, float)):
+        def contains(value: Any) -> bool:
+            return isinstance(value, list) and expected in value
+    else:
+        return _never
+    return contains
+
+
+def _op_not_contains(expected: Any) -> Predicate:
+    contains = _op_contains(expected)
+    return lambda value: not contains(value)
+
+
+def _op_any_of(expected: Any) -> Predicate:
+    if not isinstance(expected, list):
+        return _never
+    member = _membership(expected)
+
+    def any_of(value: Any) -> bool:
+        if isinstance(value, list):
+            return any(member(item) for item in value)
+        return member(value)
+
+    return any_of
+
+
+def _op_all_of(expected: Any) -> Predicate:
+    if not isinstance(expected, list):
+        return _never
+    member = _membership(expected)
+
+    def all_of(value: Any) -> bool:
+        if isinstance(value, list):
+            return all(member(item) for item in value)
+        return member(value)
+
+    return all_of
+
+
+# Ordering comparisons and string operators are written EAFP-style: a runtime
+# value of the wrong kind raises TypeError/AttributeError, which counts as a
+# non-match. That avoids an isinstance check on the (common) matching path.
+
+def _compare(compare: Callable[[Any, Any], bool], expected: Any) -> Predicate:
+    """Build an ordering predicate; only numeric expected values can match."""
+    if not isinstance(expected, (int, float)):
+        return _never
+
+    def predicate(value: Any) -> bool:
+        try:
+            return compare(value, expected)
+        except TypeError:
+            return False
+
+    return predicate
+
+
+def _op_gt(expected: Any) -> Predicate:
+    return _compare(gt, expected)
+
+
+def _op_gte(expected: Any) -> Predicate:
+    return _compare(ge, expected)
+
+
+def _op_lt(expected: Any) -> Predicate:
+    return _compare(lt, expected)
+
+
+def _op_lte(expected: Any) -> Predicate:
+    return _compare(le, expected)
+
+
+def _op_between(expected: Any) -> Predicate:
+    if not (isinstance(expected, list) and len(expected) == 2):
+        return _never
+    low, high = expected
+    if not (isinstance(low, (int, float)) and isinstance(high, (int, float))):
+        return _never
+
+    def between(value: Any) -> bool:
+        try:
+            return low <= value <= high
+        except TypeError:
+            return False
+
+    return between
+
+
+def _op_is_true(expected: Any) -> Predicate:
+    return lambda value: value is True
+
+
+def _op_is_false(expected: Any) -> Predicate:
+    return lambda value: value is False
+
+
+def _op_is_null(expected: Any) -> Predicate:
+    return lambda value: value is None
+
+
+def _op_is_not_null(expected: Any) -> Predicate:
+    return lambda value: value is not None
+
+
+def _op_matches(expected: Any) -> Predicate:
+    if not isinstance(expected, str):
+        return _never
+    try:
+        search = _compile_re(expected).search
+    except re.error:
+        return _never
+
+    def matches(value: Any) -> bool:
+        try:
+            return search(value) is not None
+        except TypeError:
+            return False
+
+    return matches
+
+
+def _op_starts_with(expected: Any) -> Predicate:
+    if not isinstance(expected, str):
+        return _never
+
+    def starts_with(value: Any) -> bool:
+        try:
+            return value.startswith(expected)
+        except (AttributeError, TypeError):
+            return False
+
+    return starts_with
+
+
+def _op_ends_with(expected: Any) -> Predicate:
+    if not isinstance(expected, str):
+        return _never
+
+    def ends_with(value: Any) -> bool:
+        try:
+            return value.endswith(expected)
+        except (AttributeError, TypeError):
+            return False
+
+    return ends_with
+
+
+_OPS: dict[str, Callable[[Any], Predicate]] = {
+    "equals": _op_equals,
+    "not_equals": _op_not_equals,
+    "in": _op_in,
+    "not_in": _op_not_in,
+    "contains": _op_contains,
+    "not_contains": _op_not_contains,
+    "any_of": _op_any_of,
+    "all_of": _op_all_of,
+    "gt": _op_gt,
+    "gte": _op_gte,
+    "lt": _op_lt,
+    "lte": _op_lte,
+    "between": _op_between,
+    "is_true": _op_is_true,
+    "is_false": _op_is_false,
+    "is_null": _op_is_null,
+    "is_not_null": _op_is_not_null,
+    "matches": _op_matches,
+    "starts_with": _op_starts_with,
+    "ends_with": _op_ends_with,
+}
+
+
+# Relative cost of each operator, used to run cheap, selective checks first.
+# Unknown operators never match, so they cost nothing and reject immediately.
+_OP_COSTS: dict[str, int] = {
+    "equals": 1,
+    "not_equals": 1,
+    "is_true": 1,
+    "is_false": 1,
+    "is_null": 1,
+    "is_not_null": 1,
+    "gt": 2,
+    "gte": 2,
+    "lt": 2,
+    "lte": 2,
+    "between": 2,
+    "in": 3,
+    "not_in": 3,
+    "any_of": 3,
+    "all_of": 3,
+    "contains": 4,
+    "not_contains": 4,
+    "starts_with": 4,
+    "ends_with": 4,
+    "matches": 10,
+}
+
+
+def _condition_cost(condition: dict[str, Any]) -> int:
+    """Estimate the cost of checking every operator in a condition."""
+    return sum(_OP_COSTS.get(operator, 0) for operator in condition)
+
+
+def _index_keys(condition: Any) -> tuple[Hashable, ...] | None:
+    """
+    Return the values a condition requires its field to equal, if any.
+
+    Only `equals` and list-valued `in` qualify. Returns None when the
+    condition does not pin the field to a finite set of hashable values.
+    """
+    if not isinstance(condition, dict):
+        return None
+    try:
+        if "equals" in condition:
+            hash(condition["equals"])
+            return (condition["equals"],)
+        if isinstance(condition.get("in"), list):
+            return tuple(set(condition["in"]))
+    except TypeError:
+        return None
+    return None
+
+
+class _EvalView:
+    """
+    The (intent, context, evidence) triple a rule is evaluated against.
+
+    Compiled getters read straight from the underlying objects, so no
+    evaluation-context dictionary is built per request.
+    """
+
+    __slots__ = ("intent", "context", "evidence")
+
+    def __init__(self, intent: "Intent", context: "Context", evidence: "Evidence") -> None:
+        self.intent = intent
+        self.context = context
+        self.evidence = evidence
+
+    def as_dict(self) -> dict[str, Any]:
+        """Materialize the nested dictionary form that field paths address."""
+        context = self.context
+        return {
+            "intent": {
+                "name": self.intent.name,
+                "confidence": self.intent.confidence,
+                "parameters": self.intent.parameters,
+            },
+            "context": {
+                "user_id": context.user_id,
+                "channel": context.channel,
+                "session_id": context.session_id,
+                **context.metadata,
+            },
+            "evidence": {
+                "facts": self.evidence.facts,
+                "rag": self.evidence.rag,
+                "topic": self.evidence.topic,
+                "metadata": self.evidence.metadata,
+            },
+        }
+
+
+Getter = Callable[[_EvalView], Any]
+
+# Fields addressable under each top-level section of a field path. Context
+# metadata keys are also addressable under "context" and take precedence.
+_VIEW_FIELDS: dict[str, tuple[str, ...]] = {
+    "intent": ("name", "confidence", "parameters"),
+    "context": ("user_id", "channel", "session_id"),
+    "evidence": ("facts", "rag", "topic", "metadata"),
+}
+
+
+def _compile_getter(parts: tuple[str, ...]) -> Getter:
+    """
+    Compile a split field path into a getter over an _EvalView.
+
+    Resolves exactly as walking the dictionary from _EvalView.as_dict()
+    would, without building it. Paths naming a whole section are rare and
+    fall back to the materialized dictionary.
+    """
+    if len(parts) < 2 or parts[0] not in _VIEW_FIELDS:
+        return lambda view: _walk(view.as_dict(), parts)
+
+    section, field, rest = parts[0], parts[1], parts[2:]
+
+    if section == "context":
+        fixed = field in _VIEW_FIELDS["context"]
+
+        def head(view: _EvalView) -> Any:
+            context = view.context
+            metadata = context.metadata
+            if field in metadata:
+                return metadata[field]
+            return getattr(context, field) if fixed else None
+
+    elif field in _VIEW_FIELDS[section]:
+        head = attrgetter(f"{section}.{field}")
+    else:
+        return lambda view: None
+
+    if not rest:
+        return head
+    return lambda view: _walk(head(view), rest)
+
+
+def _compile_condition(field_path: str, condition: dict[str, Any]) -> Callable[[_EvalView], bool]:
+    """
+    Compile a single condition into a predicate over an _EvalView.
+
+    The field path is compiled into a getter once; every operator in the condition is bound to
+    its expected value. Unknown operators compile to a predicate that never
+    matches, so the condition fails safely.
+    """
+    get = _compile_getter(tuple(field_path.split(".")))
+    checks = tuple(
+        _OPS.get(operator, lambda _expected: _never)(expected)
+        for operator, expected in sorted(
+            condition.items(), key=lambda item: _OP_COSTS.get(item[0], 0)
+        )
+    )
+
+    def predicate(view: _EvalView) -> bool:
+        value = get(view)
+        return all(check(value) for check in checks)
+
+    return predicate
+
+
+def _always(view: _EvalView) -> bool:
+    """Match for rules without conditions."""
+    return True
+
+
+def _conjoin(predicates: tuple[Callable[[_EvalView], bool], ...]) -> Callable[[_EvalView], bool]:
+    """
+    Fold condition predicates into a single callable that ANDs them in order.
+
+    Rules with up to two conditions, the common case, get a direct closure;
+    longer chains loop without building a generator per evaluation.
+    """
+    if not predicates:
+        return _always
+    if len(predicates) == 1:
+        return predicates[0]
+    if len(predicates) == 2:
+        first, second = predicates
+        return lambda view: first(view) and second(view)
+
+    def match(view: _EvalView) -> bool:
+        for predicate in predicates:
+            if not predicate(view):
+                return False
+        return True
+
+    return match
+
+
+class CompiledRule:
+    """
+    A policy rule compiled for evaluation.
+
+    Attributes:
+        order: Position in priority order, used to merge index buckets
+        name: Rule name from the policy
+        action: Action returned when the rule matches
+        reason: Rationale returned when the rule matches
+        predicates: Condition predicates, all of which must hold, cheapest first
+        match: The predicates folded into one callable
+    """
+
+    __slots__ = ("order", "name", "action", "reason", "predicates", "match")
+
+    def __init__(
+        self,
+        order: int,
+        name: str,
+        action: DecisionAction,
+        reason: str,
+        predicates: tuple[Callable[[_EvalView], bool], ...],
+    ) -> None:
+        self.order = order
+        self.name = name
+        self.action = action
+        self.reason = reason
+        self.predicates = predicates
+        self.match = _conjoin(predicates)
+
+    def __repr__(self) -> str:
+        return f"CompiledRule({self.order}, {self.name!r}, {self.action.value})"
+
+
+_rule_order = attrgetter("order")
+
+
 class PolicyEvaluator:
     """
     Evaluates policy rules against intent, context, and evidence.
@@ -18,16 +537,27 @@ class PolicyEvaluator:
     The first matching rule determines the action.
     """
 
-    def __init__(self, policy: dict[str, Any]) -> None:
+    def __init__(self, policy: dict[str, Any], cache_size: int = 0) -> None:
         """
         Initialize the policy evaluator.
 
         Args:
             policy: The validated policy dictionary
+            cache_size: Maximum number of memoized results; caching is off
+                by default (e.g. DEFAULT_CACHE_SIZE to enable it)
         """
         self.policy = policy
+        self.cache_size = cache_size
+        self._cache: OrderedDict[Hashable, tuple[DecisionAction | None, str]] = OrderedDict()
+        self._cache_lock = threading.Lock()
         self._rules: list[dict[str, Any]] = []
+        self._compiled: tuple[CompiledRule, ...] = ()
+        self._by_intent: dict[Hashable, tuple[CompiledRule, ...]] = {}
+        self._by_channel: dict[Hashable, tuple[CompiledRule, ...]] = {}
+        self._unindexed: tuple[CompiledRule, ...] = ()
+        self._key_getters: tuple[Getter, ...] = ()
         self._load_rules()
+        self._compile_rules()
 
     def _load_rules(self) -> None:
         """Load and sort rules by priority."""
@@ -37,9 +567,93 @@ class PolicyEvaluator:
         enabled_rules = [r for r in rules if r.get("enabled", True)]
 
         # Sort by priority (higher priority first), then by order in file
-        self._rules = sorted(
-            enabled_rules,
-            key=lambda r: (-r.get("priority", 0), enabled_rules.index(r)),
+        self._rules = [
+            rule
+            for _, rule in sorted(
+                enumerate(enabled_rules),
+                key=lambda indexed: (-indexed[1].get("priority", 0), indexed[0]),
+            )
+        ]
+
+    def _compile_rules(self) -> None:
+        """
+        Compile the sorted rules and bucket them by their most selective field.
+
+        Each rule becomes a CompiledRule. A rule that requires intent.name
+        (or, failing that, context.channel) to equal one of a fixed set of
+        values is stored in the matching buckets of _by_intent (or
+        _by_channel); all other rules go to _unindexed. Buckets only narrow
+        the candidates: every predicate is still checked. The rule lists
+        are frozen to tuples once built.
+        """
+        compiled_rules = []
+        by_intent: dict[Hashable, list[CompiledRule]] = {}
+        by_channel: dict[Hashable, list[CompiledRule]] = {}
+        unindexed = []
+        indexes = dict(zip(_INDEXED_FIELDS, (by_intent, by_channel)))
+
+        for order, rule in enumerate(self._rules):
+            conditions = rule.get("conditions", {})
+            compiled = CompiledRule(
+                order,
+                rule["name"],
+                DecisionAction(rule["action"]),
+                rule.get("reason", f"Matched rule: {rule['name']}"),
+                # Conditions are ANDed and side-effect free, so run the
+                # cheapest first and short-circuit on rejection
+                tuple(
+                    _compile_condition(field_path, condition)
+                    for field_path, condition in sorted(
+                        conditions.items(), key=lambda item: _condition_cost(item[1])
+                    )
+                ),
+            )
+            compiled_rules.append(compiled)
+
+            for field_path, index in indexes.items():
+                keys = _index_keys(conditions.get(field_path))
+                if keys is not None:
+                    for key in keys:
+                        index.setdefault(key, []).append(compiled)
+                    break
+            else:
+                unindexed.append(compiled)
+
+        self._compiled = tuple(compiled_rules)
+        self._by_intent = {key: tuple(rules) for key, rules in by_intent.items()}
+        self._by_channel = {key: tuple(rules) for key, rules in by_channel.items()}
+        self._unindexed = tuple(unindexed)
+
+        # Results depend only on the fields the rules read plus the fields
+        # used to pick candidates, so the cache key is built from those alone
+        field_paths = {
+            field_path
+            for rule in self._rules
+            for field_path in rule.get("conditions", {})
+        }
+        self._key_getters = tuple(
+            _compile_getter(tuple(field_path.split(".")))
+            for field_path in sorted(field_paths.union(_INDEXED_FIELDS))
+        )
+
+    def _candidates(self, intent: "Intent", context: "Context") -> Iterable[CompiledRule]:
+        """Return the rules that can match, in priority order."""
+        # Metadata is merged over the fixed context fields, so it wins here too
+        metadata = context.metadata
+        channel = metadata["channel"] if "channel" in metadata else context.channel
+
+        try:
+            by_intent = self._by_intent.get(intent.name)
+            by_channel = self._by_channel.get(channel)
+        except TypeError:
+            # Unhashable field value: it cannot equal an indexed key, but scan
+            # everything to keep matching semantics identical
+            return self._compiled
+
+        if not by_intent and not by_channel:
+            return self._unindexed
+        return heapq.merge(
+            by_intent or (), by_channel or (), self._unindexed, key=_rule_order
         )
 
     def evaluate(
@@ -51,169 +665,93 @@ class PolicyEvaluator:
         """
         Evaluate rules against the given context.
 
+        Evaluation is pure with respect to (intent, context, evidence). When
+        cache_size is set, results are memoized in a bounded LRU cache keyed
+        on a canonical form of only the fields the rules reference, so
+        per-request values such as session IDs neither fragment the cache
+        nor are retained by it unless a rule reads them. Inputs containing
+        unhashable values bypass the cache.
+
         Returns:
             A tuple of (action, rationale):
             - action: The action from the first matching rule, or None if no match
             - rationale: The reason from the matching rule
         """
-        # Build context dictionary for condition evaluation
-        eval_context = {
-            "intent": {
-                "name": intent.name,
-                "confidence": intent.confidence,
-                "parameters": intent.parameters,
-            },
-            "context": {
-                "user_id": context.user_id,
-                "channel": context.channel,
-                "session_id": context.session_id,
-                **context.metadata,
-            },
-            "evidence": {
-                "facts": evidence.facts,
-                "rag": evidence.rag,
-                "topic": evidence.topic,
-                "metadata": evidence.metadata,
-            },
-        }
-
-        # Evaluate each rule in order
-        for rule in self._rules:
-            if self._matches_rule(rule, eval_context):
-                action = DecisionAction(rule["action"])
-                reason = rule.get("reason", f"Matched rule: {rule['name']}")
-                return action, reason
+        if not self.cache_size:
+            return self._evaluate(intent, context, evidence)
 
-        # No rules matched
-        return None, "No policy rules matched"
-
-    def _matches_rule(self, rule: dict[str, Any], eval_context: dict[str, Any]) -> bool:
-        """Check if a rule's conditions match the context."""
-        conditions = rule.get("conditions", {})
-
-        # All conditions must be satisfied (AND logic)
-        for field_path, condition in conditions.items():
-            if not self._matches_condition(field_path, condition, eval_context):
-                return False
-
-        return True
-
-    def _matches_condition(
-        self, field_path: str, condition: dict[str, Any], eval_context: dict[str, Any]
-    ) -> bool:
-        """Check if a single condition matches."""
-        # Get the value at the field path
-        value = self._get_value(field_path, eval_context)
-
-        # Check each operator in the condition
-        for operator, expected in condition.items():
-            if not self._apply_operator(operator, value, expected):
-                return False
-
-        return True
-
-    def _get_value(self, path: str, context: dict[str, Any]) -> Any:
-        """Get a value from context using dotted path notation."""
-        parts = path.split(".")
-        current: Any = context
-
-        for part in parts:
-            if isinstance(current, dict):
-                if part not in current:
-                    return None
-                current = current[part]
-            elif hasattr(current, part):
-                current = getattr(current, part)
-            else:
-                return None
+        try:
+            view = _EvalView(intent, context, evidence)
+            key = _freeze(tuple(get(view) for get in self._key_getters))
+        except TypeError:
+            return self._evaluate(intent, context, evidence)
 
-        return current
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                self._cache.move_to_end(key)
+                return cached
 
-    def _apply_operator(self, operator: str, value: Any, expected: Any) -> bool:
-        """Apply a comparison operator."""
-        if operator == "equals":
-            return value == expected
+        result = self._evaluate(intent, context, evidence)
 
-        elif operator == "not_equals":
-            return value != expected
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
 
-        elif operator == "in":
-            return value in expected if isinstance(expected, list) else False
+        return result
 
-        elif operator == "not_in":
-            return value not in expected if isinstance(expected, list) else True
+    def clear_cache(self) -> None:
+        """Drop all memoized evaluation results."""
+        with self._cache_lock:
+            self._cache.clear()
 
-        elif operator == "contains":
-            if isinstance(value, str) and isinstance(expected, str):
-                return expected in value
-            elif isinstance(value, list) and isinstance(expected, (str, int, float)):
-                return expected in value
-            return False
-
-        elif operator == "not_contains":
-            return not self._apply_operator("contains", value, expected)
-
-        elif operator == "any_of":
-            if isinstance(value, list) and isinstance(expected, list):
-                return any(item in expected for item in value)
-            return value in expected if isinstance(expected, list) else False
-
-        elif operator == "all_of":
-            if isinstance(value, list) and isinstance(expected, list):
-                return all(item in expected for item in value)
-            return value in expected if isinstance(expected, list) else False
-
-        elif operator == "gt":
-            return isinstance(value, (int, float)) and value > expected
-
-        elif operator == "gte":
-            return isinstance(value, (int, float)) and value >= expected
-
-        elif operator == "lt":
-            return isinstance(value, (int, float)) and value < expected
-
-        elif operator == "lte":
-            return isinstance(value, (int, float)) and value <= expected
-
-        elif operator == "between":
-            if isinstance(value, (int, float)) and isinstance(expected, list) and len(expected) == 2:
-                return expected[0] <= value <= expected[1]
-            return False
+    def evaluate_many(
+        self,
+        records: Iterable[tuple["Intent", "Context", "Evidence"]],
+        max_workers: int | None = None,
+    ) -> list[tuple["DecisionAction | None", str]]:
+        """
+        Evaluate rules for many (intent, context, evidence) records.
 
-        elif operator == "is_true":
-            return value is True
+        Intended for replay and offline audit. Records are evaluated against
+        the compiled rules directly, without going through the result cache,
+        so a large batch does not evict live entries.
 
-        elif operator == "is_false":
-            return value is False
+        Args:
+            records: Iterable of (intent, context, evidence) tuples
+            max_workers: Evaluate on a thread pool of this size when greater
+                than 1; by default records are evaluated serially
 
-        elif operator == "is_null":
-            return value is None
+        Returns:
+            One (action, rationale) tuple per record, in input order
+        """
+        evaluate = self._evaluate
 
-        elif operator == "is_not_null":
-            return value is not None
+        if max_workers is None or max_workers <= 1:
+            return [evaluate(intent, context, evidence) for intent, context, evidence in records]
 
-        elif operator == "matches":
-            import re
-            if isinstance(value, str) and isinstance(expected, str):
-                try:
-                    return bool(re.search(expected, value))
-                except re.error:
-                    return False
-            return False
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(
+                pool.map(lambda record: evaluate(*record), records, chunksize=_BATCH_CHUNK_SIZE)
+            )
 
-        elif operator == "starts_with":
-            if isinstance(value, str) and isinstance(expected, str):
-                return value.startswith(expected)
-            return False
+    def _evaluate(
+        self,
+        intent: "Intent",
+        context: "Context",
+        evidence: "Evidence",
+    ) -> tuple["DecisionAction | None", str]:
+        """Evaluate the compiled rules without consulting the cache."""
+        view = _EvalView(intent, context, evidence)
 
-        elif operator == "ends_with":
-            if isinstance(value, str) and isinstance(expected, str):
-                return value.endswith(expected)
-            return False
+        # Evaluate each rule in order; all conditions must match (AND logic)
+        for rule in self._candidates(intent, context):
+            if rule.match(view):
+                return rule.action, rule.reason
 
-        else:
-            # Unknown operator - fail safely
-            return False
+        # No rules matched
+        return None, "No policy rules matched"
 
     def get_gate_config(self, gate_name: str) -> dict[str, Any]:
         """
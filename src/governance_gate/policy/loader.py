@@ -2,13 +2,56 @@
 Policy loader for reading YAML policy files.
 """
 
+import hashlib
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any
+from typing import Any, ClassVar
 import yaml
 
 from governance_gate.policy.schema_validation import validate_policy_schema, PolicyValidationError
 from governance_gate.core.errors import PolicyError
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Content hashes of YAML documents that already passed schema validation.
+# Validation is a pure function of the content, so an unchanged document
+# (e.g. an internal reload) does not need to be walked again.
+_VALIDATED_CACHE_SIZE = 64
+_validated: OrderedDict[str, None] = OrderedDict()
+_validated_lock = threading.Lock()
+
+# Number of policy files PolicyLoader keeps parsed, least recently used first out
+_POLICY_CACHE_SIZE = 64
+
+
+def _validate_once(policy: dict[str, Any], content: bytes) -> None:
+    """
+    Validate a parsed policy unless identical content was validated before.
+
+    Raises:
+        PolicyError: If validation fails
+    """
+    digest = hashlib.blake2b(content, digest_size=16).hexdigest()
+
+    with _validated_lock:
+        if digest in _validated:
+            _validated.move_to_end(digest)
+            return
+
+    try:
+        validate_policy_schema(policy, fast_fail=True)
+    except PolicyValidationError as e:
+        raise PolicyError(f"Policy validation failed: {e}")
+
+    with _validated_lock:
+        _validated[digest] = None
+        if len(_validated) > _VALIDATED_CACHE_SIZE:
+            _validated.popitem(last=False)
+
 
 class PolicyLoader:
     """
@@ -18,8 +61,18 @@ class PolicyLoader:
     - Rules that map conditions to actions
     - Gate configurations
     - Metadata
+
+    Loaded policies are cached per resolved path and reused while the file's
+    modification time and size are unchanged; a changed file replaces its
+    path's entry. The cache holds the most recently used _POLICY_CACHE_SIZE
+    files. Cached policy dictionaries are shared between loaders and must be
+    treated as read-only.
     """
 
+    # resolved path -> ((st_mtime_ns, st_size), validated policy), in LRU order
+    _cache: ClassVar[OrderedDict[str, tuple[tuple[int, int], dict[str, Any]]]] = OrderedDict()
+    _cache_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self, policy_path: str | Path) -> None:
         """
         Initialize the policy loader.
@@ -43,9 +96,20 @@ class PolicyLoader:
         if not self.policy_path.exists():
             raise PolicyError(f"Policy file not found: {self.policy_path}")
 
+        cache_key = str(self.policy_path.resolve())
+        stat = self.policy_path.stat()
+        stamp = (stat.st_mtime_ns, stat.st_size)
+
+        with PolicyLoader._cache_lock:
+            cached = PolicyLoader._cache.get(cache_key)
+            if cached is not None and cached[0] == stamp:
+                PolicyLoader._cache.move_to_end(cache_key)
+                self._policy = cached[1]
+                return cached[1]
+
         try:
-            with open(self.policy_path, "r") as f:
-                policy = yaml.safe_load(f)
+            content = self.policy_path.read_bytes()
+            policy = PolicyLoader.parse_yaml(content)
         except yaml.YAMLError as e:
             raise PolicyError(f"Failed to parse YAML file {self.policy_path}: {e}")
         except Exception as e:
@@ -55,14 +119,30 @@ class PolicyLoader:
             raise PolicyError(f"Policy file must contain a dictionary, got {type(policy).__name__}")
 
         # Validate the policy structure
-        try:
-            validate_policy_schema(policy)
-        except PolicyValidationError as e:
-            raise PolicyError(f"Policy validation failed: {e}")
+        _validate_once(policy, content)
 
+        with PolicyLoader._cache_lock:
+            PolicyLoader._cache[cache_key] = (stamp, policy)
+            PolicyLoader._cache.move_to_end(cache_key)
+            if len(PolicyLoader._cache) > _POLICY_CACHE_SIZE:
+                PolicyLoader._cache.popitem(last=False)
         self._policy = policy
         return policy
 
+    @classmethod
+    def invalidate(cls, policy_path: str | Path | None = None) -> None:
+        """
+        Drop cached policies.
+
+        Args:
+            policy_path: Path of the policy to drop, or None to clear the whole cache
+        """
+        with cls._cache_lock:
+            if policy_path is None:
+                cls._cache.clear()
+            else:
+                cls._cache.pop(str(Path(policy_path).resolve()), None)
+
     @property
     def policy(self) -> dict[str, Any]:
         """Get the loaded policy (loads if not already loaded)."""
@@ -91,6 +171,25 @@ class PolicyLoader:
         """Get policy metadata."""
         return self.policy.get("metadata", {})
 
+    @staticmethod
+    def parse_yaml(content: bytes | str) -> Any:
+        """
+        Parse policy YAML without validating it.
+
+        Uses the same YAML loader as load() and load_from_string(), so tools
+        that report on a policy file see exactly what the loader sees.
+
+        Args:
+            content: YAML content as bytes or a string
+
+        Returns:
+            The parsed document
+
+        Raises:
+            yaml.YAMLError: If the content is not valid YAML
+        """
+        return yaml.load(content, Loader=_YamlLoader)
+
     @staticmethod
     def load_from_string(yaml_content: str) -> dict[str, Any]:
         """
@@ -106,15 +205,39 @@ class PolicyLoader:
             PolicyError: If parsing or validation fails
         """
         try:
-            policy = yaml.safe_load(yaml_content)
+            policy = PolicyLoader.parse_yaml(yaml_content)
         except yaml.YAMLError as e:
             raise PolicyError(f"Failed to parse YAML content: {e}")
 
         if not isinstance(policy, dict):
             raise PolicyError(f"Policy must contain a dictionary, got {type(policy).__name__}")
 
+        _validate_once(policy, yaml_content.encode("utf-8", "surrogatepass"))
+
+        return policy
+
+    @staticmethod
+    def load_from_dict(policy: dict[str, Any]) -> dict[str, Any]:
+        """
+        Load a policy that is already a dictionary.
+
+        Use this for policies composed in code instead of round-tripping them
+        through YAML; only schema validation runs.
+
+        Args:
+            policy: Policy dictionary
+
+        Returns:
+            The validated policy dictionary
+
+        Raises:
+            PolicyError: If validation fails
+        """
+        if not isinstance(policy, dict):
+            raise PolicyError(f"Policy must be a dictionary, got {type(policy).__name__}")
+
         try:
-            validate_policy_schema(policy)
+            validate_policy_schema(policy, fast_fail=True)
         except PolicyValidationError as e:
             raise PolicyError(f"Policy validation failed: {e}")
 
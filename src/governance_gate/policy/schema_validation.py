@@ -4,6 +4,7 @@ Policy schema validation.
 Validates the structure and content of policy files.
 """
 
+import re
 from typing import Any
 
 
@@ -14,7 +15,7 @@ OPTIONAL_TOP_LEVEL_KEYS = ["description", "gates", "metadata"]
 REQUIRED_RULE_KEYS = ["name", "conditions", "action"]
 OPTIONAL_RULE_KEYS = ["reason", "enabled", "priority"]
 
-SUPPORTED_OPERATORS = {
+SUPPORTED_OPERATORS = frozenset({
     # Equality operators
     "equals",
     "not_equals",
@@ -39,26 +40,61 @@ SUPPORTED_OPERATORS = {
     "matches",
     "starts_with",
     "ends_with",
+})
+
+SUPPORTED_ACTIONS = frozenset({"ALLOW", "RESTRICT", "ESCALATE", "STOP"})
+
+# Display forms for error messages, computed once
+_SORTED_OPERATORS = sorted(SUPPORTED_OPERATORS)
+_SORTED_ACTIONS = sorted(SUPPORTED_ACTIONS)
+
+# Kind of expected value each operator requires ("range" is a [low, high]
+# pair of numbers). Checking them here rejects a malformed policy at load
+# time; the evaluator would otherwise compile such a condition to a
+# predicate that never matches.
+OPERATOR_VALUE_KINDS = {
+    "equals": "any",
+    "not_equals": "any",
+    "contains": "any",
+    "not_contains": "any",
+    "in": "list",
+    "not_in": "list",
+    "any_of": "list",
+    "all_of": "list",
+    "gt": "num",
+    "gte": "num",
+    "lt": "num",
+    "lte": "num",
+    "between": "range",
+    "is_true": "bool",
+    "is_false": "bool",
+    "is_null": "bool",
+    "is_not_null": "bool",
+    "matches": "str",
+    "starts_with": "str",
+    "ends_with": "str",
 }
 
-SUPPORTED_ACTIONS = {"ALLOW", "RESTRICT", "ESCALATE", "STOP"}
-
 
 class PolicyValidationError(Exception):
     """Raised when policy validation fails."""
 
-    def __init__(self, message: str, path: str = ""):
+    def __init__(self, message: str, path: str = "", errors: list[str] | None = None):
         self.message = message
         self.path = path
+        self.errors = errors or []
         super().__init__(f"{path}: {message}" if path else message)
 
 
-def validate_policy_schema(policy: dict[str, Any]) -> list[str]:
+def validate_policy_schema(policy: dict[str, Any], *, fast_fail: bool = False) -> list[str]:
     """
     Validate the policy schema and return a list of errors.
 
     Args:
         policy: The policy dictionary to validate
+        fast_fail: Stop at the first invalid section (top-level keys or a
+            rule) instead of collecting every error. Use when loading a
+            policy for service; leave off for linting.
 
     Returns:
         A list of error messages (empty if valid)
@@ -85,6 +121,9 @@ def validate_policy_schema(policy: dict[str, Any]) -> list[str]:
         if not isinstance(policy["name"], str) or not policy["name"].strip():
             errors.append("Policy name must be a non-empty string")
 
+    if fast_fail and errors:
+        _raise_validation_error(errors)
+
     # Validate rules
     if "rules" in policy:
         if not isinstance(policy["rules"], list):
@@ -93,6 +132,8 @@ def validate_policy_schema(policy: dict[str, Any]) -> list[str]:
             for i, rule in enumerate(policy["rules"]):
                 rule_errors = _validate_rule(rule, f"rules[{i}]")
                 errors.extend(rule_errors)
+                if fast_fail and errors:
+                    _raise_validation_error(errors)
 
     # Validate gates configuration
     if "gates" in policy:
@@ -104,11 +145,18 @@ def validate_policy_schema(policy: dict[str, Any]) -> list[str]:
                     errors.append(f"Gate config for '{gate_name}' must be a dictionary")
 
     if errors:
-        raise PolicyValidationError(f"Policy validation failed with {len(errors)} error(s)")
+        _raise_validation_error(errors)
 
     return []
 
 
+def _raise_validation_error(errors: list[str]) -> None:
+    """Raise a PolicyValidationError carrying the collected errors."""
+    raise PolicyValidationError(
+        f"Policy validation failed with {len(errors)} error(s)", errors=errors
+    )
+
+
 def _validate_rule(rule: dict[str, Any], path: str) -> list[str]:
     """Validate a single rule."""
     errors = []
@@ -127,7 +175,7 @@ def _validate_rule(rule: dict[str, Any], path: str) -> list[str]:
     if "action" in rule:
         if rule["action"] not in SUPPORTED_ACTIONS:
             errors.append(
-                f"{path}: Invalid action '{rule['action']}'. Must be one of: {SUPPORTED_ACTIONS}"
+                f"{path}: Invalid action '{rule['action']}'. Must be one of: {_SORTED_ACTIONS}"
             )
 
     # Validate conditions
@@ -162,26 +210,50 @@ def _validate_conditions(conditions: dict[str, Any], path: str) -> list[str]:
             if operator not in SUPPORTED_OPERATORS:
                 errors.append(
                     f"{path}.{field_path}: Unsupported operator '{operator}'. "
-                    f"Supported: {sorted(SUPPORTED_OPERATORS)}"
+                    f"Supported: {_SORTED_OPERATORS}"
                 )
 
             # Validate operator-specific value types
-            if operator in {"gt", "gte", "lt", "lte", "between"}:
+            kind = OPERATOR_VALUE_KINDS.get(operator)
+            if kind == "num":
                 if not isinstance(value, (int, float)):
                     errors.append(
                         f"{path}.{field_path}: Operator '{operator}' requires numeric value"
                     )
 
-            elif operator in {"in", "not_in", "any_of", "all_of"}:
+            elif kind == "range":
+                if not (
+                    isinstance(value, list)
+                    and len(value) == 2
+                    and all(isinstance(bound, (int, float)) for bound in value)
+                ):
+                    errors.append(
+                        f"{path}.{field_path}: Operator '{operator}' requires a [low, high] list of numbers"
+                    )
+
+            elif kind == "list":
                 if not isinstance(value, list):
                     errors.append(
                         f"{path}.{field_path}: Operator '{operator}' requires list value"
                     )
 
-            elif operator in {"is_true", "is_false", "is_null", "is_not_null"}:
+            elif kind == "bool":
                 if value is not True and value is not False:
                     errors.append(
                         f"{path}.{field_path}: Operator '{operator}' value must be true or false"
                     )
 
+            elif kind == "str":
+                if not isinstance(value, str):
+                    errors.append(
+                        f"{path}.{field_path}: Operator '{operator}' requires string value"
+                    )
+                elif operator == "matches":
+                    try:
+                        re.compile(value)
+                    except re.error as e:
+                        errors.append(
+                            f"{path}.{field_path}: Invalid regular expression '{value}': {e}"
+                        )
+
     return errors
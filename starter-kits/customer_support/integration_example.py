@@ -5,8 +5,25 @@ Shows how to integrate governance gate into a customer support agent workflow.
 """
 
 import requests
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import json
 import os
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict, deque
 from typing import Dict, Any, Optional
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # optional: falls back to the stdlib encoder
+    orjson = None
 
 # Configuration
 GATE_API_URL = os.environ.get(
@@ -18,6 +35,328 @@ POLICY_PATH = os.environ.get(
     "starter-kits/customer_support/policy.yaml"
 )
 
+# "http" calls the gate API; "inproc" evaluates with the governance_gate
+# package in this process, skipping the network entirely. Use inproc when the
+# agent and the policy file live on the same host.
+GATE_TRANSPORT = os.environ.get("GATE_TRANSPORT", "http")
+
+# Decision logs are emitted at INFO; a higher LOG_LEVEL skips them entirely
+LOG_DECISIONS = os.environ.get("LOG_LEVEL", "INFO").upper() in ("DEBUG", "INFO")
+
+# Pending decision logs beyond this are dropped rather than blocking requests
+LOG_QUEUE_MAX = 10000
+LOG_BATCH_SIZE = 256
+
+# Intent classes used when collecting evidence
+_REALTIME_INTENTS = frozenset({"order_status_query", "refund_status_query"})
+_FINANCIAL_INTENTS = frozenset({
+    "refund_request", "compensation_request",
+    "credit_request", "discount_request"
+})
+_AUTHORITY_INTENTS = frozenset({"policy_change", "exception_request", "account_closure"})
+_SENSITIVE_INTENTS = frozenset({"legal_threat", "regulatory_complaint"})
+_ALL_INTENTS = (
+    _REALTIME_INTENTS | _FINANCIAL_INTENTS | _AUTHORITY_INTENTS | _SENSITIVE_INTENTS
+)
+
+# Escalation ticket prefixes for known intents, built once
+_TICKET_PREFIX = {intent: f"TICKET-{intent.upper()}-" for intent in _ALL_INTENTS}
+
+# Split connect/read budgets, set slightly above the gate's observed p95
+# (see CustomerSupportAgent._current_p95) so a stuck connect fails fast
+GATE_CONNECT_TIMEOUT = float(os.environ.get("GATE_CONNECT_TIMEOUT", "0.2"))
+GATE_READ_TIMEOUT = float(os.environ.get("GATE_READ_TIMEOUT", "0.3"))
+
+# Transient gate failures are retried once. POST is safe to retry because
+# the gate is side-effect free.
+GATE_MAX_RETRIES = 1
+RETRY_STATUSES = (502, 503, 504)
+RETRY_BACKOFF = 0.05
+RETRY_BACKOFF_MAX = 0.1
+
+# Bulkhead: gate calls allowed in flight per agent; excess calls fail closed
+# after waiting at most BULKHEAD_WAIT seconds (sync path) for a slot
+GATE_MAX_INFLIGHT = int(os.environ.get("GATE_MAX_INFLIGHT", "32"))
+BULKHEAD_WAIT = 0.01
+
+# Short-lived decision cache for identical requests; 0 disables it
+GATE_CACHE_TTL = float(os.environ.get("GATE_CACHE_TTL", "5"))
+GATE_CACHE_SIZE = 2048
+
+# Decisions that are never served from the cache
+UNCACHED_ACTIONS = frozenset({"ESCALATE", "STOP"})
+
+# Number of recent gate latencies kept for p95 estimation
+LATENCY_WINDOW = 512
+
+# Connection pool sizing for the gate session. The gate is called once per
+# user turn, so keeping connections alive avoids a TCP/TLS handshake per call.
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 128
+
+# HTTP/2 for the async client needs the optional `h2` package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+def _dumps(obj: Any, sort_keys: bool = True) -> bytes:
+    """
+    Encode an object as compact JSON bytes, canonical (key-sorted) by default.
+
+    Non-string dict keys are written as strings, as the json module does.
+    Raises TypeError or ValueError for objects that cannot be encoded.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_SORT_KEYS if sort_keys else 0)
+        return orjson.dumps(obj, default=str, option=option)
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), default=str).encode()
+
+
+def _loads(data: bytes) -> Any:
+    """Decode a JSON response body."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Decision logs are written by a background thread so the request path only
+# enqueues. Started on first use; drained at interpreter exit.
+_LOG_Q: "queue.SimpleQueue[Optional[Dict[str, Any]]]" = queue.SimpleQueue()
+_log_thread: Optional[threading.Thread] = None
+_log_thread_lock = threading.Lock()
+_log_dropped = 0
+_log_dropped_lock = threading.Lock()
+
+
+def _reset_log_writer() -> None:
+    """Give a forked child its own queue and writer; the parent's thread did not survive the fork."""
+    global _LOG_Q, _log_thread, _log_thread_lock, _log_dropped, _log_dropped_lock
+    _LOG_Q = queue.SimpleQueue()
+    _log_thread = None
+    _log_thread_lock = threading.Lock()
+    _log_dropped = 0
+    _log_dropped_lock = threading.Lock()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_log_writer)
+
+
+def _write_stderr(data: bytes) -> None:
+    """Write bytes to fd 2, handling partial writes."""
+    view = memoryview(data)
+    while view:
+        written = os.write(2, view)
+        view = view[written:]
+
+
+def _log_worker() -> None:
+    """Drain the log queue, writing each batch as JSON lines in one write."""
+    while True:
+        entry = _LOG_Q.get()
+        stop = entry is None
+        batch = [] if stop else [entry]
+        while len(batch) < LOG_BATCH_SIZE:
+            try:
+                entry = _LOG_Q.get_nowait()
+            except queue.Empty:
+                break
+            if entry is None:
+                stop = True
+                break
+            batch.append(entry)
+        if batch:
+            _write_stderr(b"".join(_dumps(item, sort_keys=False) + b"\n" for item in batch))
+        if stop:
+            return
+
+
+def _flush_logs() -> None:
+    """Stop the log worker after it has written everything queued."""
+    if _log_thread is not None and _log_thread.is_alive():
+        _LOG_Q.put(None)
+        _log_thread.join(timeout=2.0)
+
+
+def _enqueue_log(entry: Dict[str, Any]) -> None:
+    """Hand a log entry to the background writer, dropping it if the queue is full."""
+    global _log_thread, _log_dropped
+
+    if _log_thread is None:
+        with _log_thread_lock:
+            if _log_thread is None:
+                _log_thread = threading.Thread(
+                    target=_log_worker, name="governance-log", daemon=True
+                )
+                _log_thread.start()
+                atexit.register(_flush_logs)
+
+    if _LOG_Q.qsize() >= LOG_QUEUE_MAX:
+        # Producers run on many threads; += is not atomic
+        with _log_dropped_lock:
+            _log_dropped += 1
+        return
+    _LOG_Q.put(entry)
+
+
+# In-process gate (pipeline, policy dict, policy evaluator) per policy path,
+# built on first use
+_inproc_gates: Dict[str, Any] = {}
+_inproc_lock = threading.Lock()
+
+
+def _inproc_gate(policy_path: str):
+    """
+    Return the shared in-process (pipeline, policy evaluator) for a policy file.
+
+    PolicyLoader re-reads the file only when its mtime or size changes and
+    otherwise returns the same policy dict, so the evaluator is rebuilt
+    exactly when the policy file has been edited.
+    """
+    from governance_gate import GovernancePipeline
+    from governance_gate.gates import (
+        FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate, SafetyGate
+    )
+    from governance_gate.policy.evaluator import PolicyEvaluator
+    from governance_gate.policy.loader import PolicyLoader
+
+    policy_dict = PolicyLoader(policy_path).load()
+    gate = _inproc_gates.get(policy_path)
+    if gate is not None and gate[1] is policy_dict:
+        return gate[0], gate[2]
+
+    with _inproc_lock:
+        gate = _inproc_gates.get(policy_path)
+        if gate is None or gate[1] is not policy_dict:
+            # Same gate order as the API server
+            pipeline = gate[0] if gate is not None else GovernancePipeline(gates=[
+                SafetyGate(),
+                FactVerifiabilityGate(),
+                UncertaintyGate(),
+                ResponsibilityGate(),
+            ])
+            gate = _inproc_gates[policy_path] = (pipeline, policy_dict, PolicyEvaluator(policy_dict))
+    return gate[0], gate[2]
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given retry attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF * 2 ** attempt))
+
+
+class _TTLCache:
+    """
+    Bounded LRU cache whose entries expire ttl seconds after insertion.
+
+    Decisions are stored and returned as shallow copies, so callers never
+    share one dict.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._data: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return dict(value)
+                del self._data[key]
+            self.misses += 1
+            return None
+
+    def put(self, key: bytes, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, dict(value))
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class _Breaker:
+    """
+    Client-side circuit breaker for the gate call.
+
+    CLOSED: calls go through; outcomes are recorded in a sliding window.
+    OPEN: once the failure rate over the window reaches the threshold, calls
+        are short-circuited to the fail-closed fallback for open_state_delay
+        seconds instead of each waiting out the timeout.
+    HALF_OPEN: after the delay, one probe call is let through; success closes
+        the breaker, failure reopens it.
+    """
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+    def __init__(
+        self,
+        window_size: int = 20,
+        failure_rate_threshold: float = 0.5,
+        minimum_request_volume: int = 5,
+        open_state_delay: float = 5.0,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.minimum_request_volume = minimum_request_volume
+        self.open_state_delay = open_state_delay
+        self.state = self.CLOSED
+        self._window: deque = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def should_short_circuit(self) -> bool:
+        """Return True if the call should skip the gate and use the fallback."""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return False
+            if self.state == self.OPEN:
+                if time.monotonic() - self._opened_at < self.open_state_delay:
+                    return True
+                self.state = self.HALF_OPEN
+            # HALF_OPEN: let a single probe through
+            if self._probe_in_flight:
+                return True
+            self._probe_in_flight = True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self.state = self.CLOSED
+                self._window.clear()
+                self._probe_in_flight = False
+                return
+            self._window.append(True)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            if self.state == self.HALF_OPEN:
+                self._open()
+                return
+            self._window.append(False)
+            if len(self._window) >= self.minimum_request_volume:
+                failures = self._window.count(False)
+                if failures / len(self._window) >= self.failure_rate_threshold:
+                    self._open()
+
+    def _open(self) -> None:
+        self.state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._probe_in_flight = False
+        self._window.clear()
+
 
 class CustomerSupportAgent:
     """
@@ -26,8 +365,61 @@ class CustomerSupportAgent:
     The gate is consulted BEFORE taking any action.
     """
 
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, gate_url: str = GATE_API_URL, transport: str = GATE_TRANSPORT):
+        self._url = gate_url
+        self._transport = transport
+
+        # Pooled keep-alive session; connect errors and gateway 5xx are
+        # retried once (read timeouts are not)
+        adapter = HTTPAdapter(
+            pool_connections=POOL_CONNECTIONS,
+            pool_maxsize=POOL_MAXSIZE,
+            pool_block=False,
+            max_retries=Retry(
+                total=GATE_MAX_RETRIES,
+                connect=GATE_MAX_RETRIES,
+                read=0,
+                status_forcelist=RETRY_STATUSES,
+                backoff_factor=RETRY_BACKOFF,
+                respect_retry_after_header=True,
+                allowed_methods=frozenset(["POST"]),
+            ),
+        )
+        self.session = self._new_session(adapter)
+
+        # Retry-free session for calls made while the breaker is not CLOSED,
+        # so a half-open probe is a single attempt as on the async path
+        self._probe_session = self._new_session(HTTPAdapter(max_retries=0))
+
+        # Async client, created on first use by the async path
+        self._client = None
+
+        # Shared by the sync and async paths
+        self._breaker = _Breaker()
+        self._bulkhead = threading.BoundedSemaphore(GATE_MAX_INFLIGHT)
+        self._async_bulkhead: Optional[asyncio.Semaphore] = None
+        self._latencies: deque = deque(maxlen=LATENCY_WINDOW)
+        self._cache = _TTLCache(GATE_CACHE_SIZE, GATE_CACHE_TTL) if GATE_CACHE_TTL > 0 else None
+
+        # Governance action -> handler
+        self._dispatch = {
+            "ALLOW": self._do_allow,
+            "RESTRICT": self._do_restrict,
+            "ESCALATE": self._do_escalate,
+            "STOP": self._do_stop,
+        }
+
+    @staticmethod
+    def _new_session(adapter: HTTPAdapter) -> requests.Session:
+        """Create a keep-alive JSON session that sends requests through adapter."""
+        session = requests.Session()
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        session.headers.update({
+            "Connection": "keep-alive",
+            "Content-Type": "application/json",
+        })
+        return session
 
     def handle_request(
         self,
@@ -68,6 +460,40 @@ class CustomerSupportAgent:
         # Step 3: Act based on governance decision
         return self._execute_decision(decision, user_input, intent, additional_context)
 
+    async def handle_request_async(
+        self,
+        user_input: str,
+        intent: str,
+        intent_confidence: float,
+        user_id: str,
+        channel: str,
+        additional_context: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of handle_request for callers running an event loop.
+
+        The gate call goes through a shared httpx.AsyncClient (HTTP/2 when
+        available), so concurrent checks share connections instead of
+        blocking the loop.
+        """
+        evidence = self._collect_evidence(user_input, intent, additional_context)
+
+        decision = await self._check_governance_async(
+            intent=intent,
+            intent_confidence=intent_confidence,
+            user_id=user_id,
+            channel=channel,
+            evidence=evidence
+        )
+
+        return self._execute_decision(decision, user_input, intent, additional_context)
+
+    async def aclose(self) -> None:
+        """Close the async client, if one was created."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     def _collect_evidence(
         self,
         user_input: str,
@@ -81,7 +507,7 @@ class CustomerSupportAgent:
                 "verifiable": True,  # TODO: Check based on data availability
                 "verifiable_confidence": 0.9,  # TODO: From actual data sources
                 "source": "database",
-                "requires_realtime": intent in ["order_status_query", "refund_status_query"]
+                "requires_realtime": intent in _REALTIME_INTENTS
             },
             "rag": {
                 "confidence": 0.85,  # TODO: From RAG system
@@ -89,15 +515,10 @@ class CustomerSupportAgent:
                 "kb_age_days": 5  # TODO: From knowledge base metadata
             },
             "topic": {
-                "has_financial_impact": intent in [
-                    "refund_request", "compensation_request",
-                    "credit_request", "discount_request"
-                ],
-                "requires_authority": intent in [
-                    "policy_change", "exception_request", "account_closure"
-                ],
+                "has_financial_impact": intent in _FINANCIAL_INTENTS,
+                "requires_authority": intent in _AUTHORITY_INTENTS,
                 "is_irreversible": intent == "account_closure",
-                "is_sensitive": intent in ["legal_threat", "regulatory_complaint"],
+                "is_sensitive": intent in _SENSITIVE_INTENTS,
                 "harm_risk": False
             }
         }
@@ -123,42 +544,261 @@ class CustomerSupportAgent:
             Decision dict with action, final_gate, rationale, etc.
         """
 
+        if self._transport == "inproc":
+            return self._check_governance_inproc(
+                intent, intent_confidence, user_id, channel, evidence
+            )
+
+        # Encoded once: the same canonical bytes are the request body and the cache key
         try:
-            response = self.session.post(
-                GATE_API_URL,
-                json={
-                    "intent": {
-                        "name": intent,
-                        "confidence": intent_confidence,
-                        "parameters": {"user_input": evidence.get("user_input", "")}
-                    },
-                    "context": {
-                        "user_id": user_id,
-                        "channel": channel
-                    },
-                    "evidence": evidence,
-                    "policy_path": POLICY_PATH
-                },
-                timeout=2.0  # 2 second timeout
+            body = _dumps(self._build_payload(intent, intent_confidence, user_id, channel, evidence))
+        except (TypeError, ValueError) as e:
+            # e.g. mixed-type keys cannot be sorted by the json fallback
+            return self._unavailable_decision(e)
+        cache_key = self._cache_key(body)
+        cached = self._cache.get(cache_key) if self._cache else None
+        if cached is not None:
+            self._log_decision(cached, intent, user_id, cached=True)
+            return cached
+
+        if not self._bulkhead.acquire(timeout=BULKHEAD_WAIT):
+            return self._rejected_decision("too many requests in flight", "bulkhead_full")
+
+        try:
+            if self._breaker.should_short_circuit():
+                return self._rejected_decision("circuit breaker open", "breaker_open")
+
+            session = self.session if self._breaker.state == _Breaker.CLOSED else self._probe_session
+            response = session.post(
+                self._url,
+                data=body,
+                timeout=(GATE_CONNECT_TIMEOUT, GATE_READ_TIMEOUT)
             )
 
+            self._latencies.append(response.elapsed.total_seconds())
             response.raise_for_status()
-            decision = response.json()
+            decision = _loads(response.content)
 
-            # Log decision for observability
-            self._log_decision(decision, intent, user_id)
+        except (requests.exceptions.RequestException, ValueError) as e:
+            self._breaker.record_failure()
+            return self._unavailable_decision(e)
 
-            return decision
+        except BaseException:
+            # Any other exit still settles the call, so a half-open probe is released
+            self._breaker.record_failure()
+            raise
 
-        except requests.exceptions.RequestException as e:
-            # Fallback: ESCALATE on error (fail-closed)
-            return {
-                "action": "ESCALATE",
-                "final_gate": None,
-                "rationale": f"Governance gate unavailable: {str(e)}",
-                "trace_id": None,
-                "error": "governance_unavailable"
-            }
+        finally:
+            self._bulkhead.release()
+
+        self._breaker.record_success()
+        self._store_decision(cache_key, decision)
+
+        # Log decision for observability
+        self._log_decision(decision, intent, user_id)
+
+        return decision
+
+    async def _check_governance_async(
+        self,
+        intent: str,
+        intent_confidence: float,
+        user_id: str,
+        channel: str,
+        evidence: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Consult governance gate for decision without blocking the event loop."""
+        if self._transport == "inproc":
+            # CPU-only and short; no I/O to await
+            return self._check_governance_inproc(
+                intent, intent_confidence, user_id, channel, evidence
+            )
+
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers={"Content-Type": "application/json"},
+                http2=HTTP2_AVAILABLE,
+                timeout=httpx.Timeout(GATE_READ_TIMEOUT, connect=GATE_CONNECT_TIMEOUT),
+                limits=httpx.Limits(max_connections=128, max_keepalive_connections=64),
+            )
+
+        # Encoded once: the same canonical bytes are the request body and the cache key
+        try:
+            body = _dumps(self._build_payload(intent, intent_confidence, user_id, channel, evidence))
+        except (TypeError, ValueError) as e:
+            # e.g. mixed-type keys cannot be sorted by the json fallback
+            return self._unavailable_decision(e)
+        cache_key = self._cache_key(body)
+        cached = self._cache.get(cache_key) if self._cache else None
+        if cached is not None:
+            self._log_decision(cached, intent, user_id, cached=True)
+            return cached
+
+        if self._async_bulkhead is None:
+            self._async_bulkhead = asyncio.Semaphore(GATE_MAX_INFLIGHT)
+        if self._async_bulkhead.locked():
+            return self._rejected_decision("too many requests in flight", "bulkhead_full")
+
+        if self._breaker.should_short_circuit():
+            return self._rejected_decision("circuit breaker open", "breaker_open")
+
+        async with self._async_bulkhead:
+            try:
+                decision = await self._post_async(body)
+            except (httpx.HTTPError, ValueError) as e:
+                self._breaker.record_failure()
+                return self._unavailable_decision(e)
+            except BaseException:
+                # Includes CancelledError (e.g. a wait_for timeout), so a
+                # half-open probe is released instead of staying in flight
+                self._breaker.record_failure()
+                raise
+
+        self._breaker.record_success()
+        self._store_decision(cache_key, decision)
+
+        # Log decision for observability
+        self._log_decision(decision, intent, user_id)
+
+        return decision
+
+    def _check_governance_inproc(
+        self,
+        intent: str,
+        intent_confidence: float,
+        user_id: str,
+        channel: str,
+        evidence: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Evaluate the governance pipeline in this process instead of over HTTP."""
+        from governance_gate import Intent, Context, Evidence
+
+        try:
+            pipeline, policy = _inproc_gate(POLICY_PATH)
+            decision = pipeline.evaluate(
+                Intent(
+                    name=intent,
+                    confidence=intent_confidence,
+                    parameters={"user_input": evidence.get("user_input", "")},
+                ),
+                Context(user_id=user_id, channel=channel),
+                Evidence(
+                    facts=evidence.get("facts", {}),
+                    rag=evidence.get("rag", {}),
+                    topic=evidence.get("topic", {}),
+                    metadata=evidence.get("metadata", {}),
+                ),
+                policy,
+            ).to_dict()
+        except Exception as e:
+            # Invalid input or policy fails closed, as on the HTTP transport
+            return self._unavailable_decision(e)
+
+        # Log decision for observability
+        self._log_decision(decision, intent, user_id)
+
+        return decision
+
+    async def _post_async(self, body: bytes) -> Dict[str, Any]:
+        """
+        POST to the gate, retrying transient failures.
+
+        Mirrors the sync adapter's retry policy: connect errors and gateway
+        5xx are retried, read timeouts are not. Retries only happen while the
+        breaker is fully closed, so a half-open probe gets exactly one attempt.
+        """
+        import httpx
+
+        attempt = 0
+        while True:
+            can_retry = attempt < GATE_MAX_RETRIES and self._breaker.state == _Breaker.CLOSED
+            try:
+                started = time.perf_counter()
+                response = await self._client.post(self._url, content=body)
+                self._latencies.append(time.perf_counter() - started)
+                if response.status_code not in RETRY_STATUSES or not can_retry:
+                    response.raise_for_status()
+                    return _loads(response.content)
+            except (httpx.ConnectError, httpx.ConnectTimeout):
+                if not can_retry:
+                    raise
+
+            attempt += 1
+            await asyncio.sleep(_backoff_delay(attempt))
+
+    def _current_p95(self) -> Optional[float]:
+        """
+        Return the p95 of recent gate latencies in seconds.
+
+        Use it to re-tune GATE_READ_TIMEOUT from real traffic. Returns None
+        until a latency has been recorded.
+        """
+        if not self._latencies:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+
+    def cache_hit_ratio(self) -> float:
+        """Fraction of gate checks served from the decision cache, for TTL tuning."""
+        return self._cache.hit_ratio() if self._cache else 0.0
+
+    @staticmethod
+    def _cache_key(body: bytes) -> bytes:
+        """Stable digest of an encoded request payload."""
+        return hashlib.blake2b(body, digest_size=16).digest()
+
+    def _store_decision(self, cache_key: bytes, decision: Dict[str, Any]) -> None:
+        """Cache a decision unless it must always be re-evaluated."""
+        if self._cache is None:
+            return
+        if decision.get("action") in UNCACHED_ACTIONS or decision.get("error"):
+            return
+        self._cache.put(cache_key, decision)
+
+    def _build_payload(
+        self,
+        intent: str,
+        intent_confidence: float,
+        user_id: str,
+        channel: str,
+        evidence: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """Build the /decision request body."""
+        return {
+            "intent": {
+                "name": intent,
+                "confidence": intent_confidence,
+                "parameters": {"user_input": evidence.get("user_input", "")}
+            },
+            "context": {
+                "user_id": user_id,
+                "channel": channel
+            },
+            "evidence": evidence,
+            "policy_path": POLICY_PATH
+        }
+
+    def _unavailable_decision(self, error: Exception) -> Dict[str, Any]:
+        """Fallback: ESCALATE when the gate cannot be reached (fail-closed)."""
+        return {
+            "action": "ESCALATE",
+            "final_gate": None,
+            "rationale": f"Governance gate unavailable: {str(error)}",
+            "trace_id": None,
+            "error": "governance_unavailable"
+        }
+
+    def _rejected_decision(self, reason: str, error: str) -> Dict[str, Any]:
+        """Fallback: ESCALATE without calling the gate (breaker open, bulkhead full)."""
+        return {
+            "action": "ESCALATE",
+            "final_gate": None,
+            "rationale": f"Governance gate unavailable: {reason}",
+            "trace_id": None,
+            "error": error
+        }
 
     def _execute_decision(
         self,
@@ -169,64 +809,91 @@ class CustomerSupportAgent:
     ) -> Dict[str, Any]:
         """Execute the appropriate action based on governance decision."""
 
-        action = decision["action"]
+        handler = self._dispatch.get(decision["action"])
+        if handler is None:
+            return self._do_unknown(decision)
+        return handler(decision, user_input, intent, additional_context)
 
-        if action == "ALLOW":
-            # Proceed with normal agent handling
-            result = self._handle_normally(user_input, intent, additional_context)
-            return {
-                "status": "completed",
-                "governance_action": "ALLOW",
-                "result": result,
-                "trace_id": decision["trace_id"]
-            }
+    def _do_allow(
+        self,
+        decision: Dict[str, Any],
+        user_input: str,
+        intent: str,
+        additional_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Proceed with normal agent handling."""
+        result = self._handle_normally(user_input, intent, additional_context)
+        return {
+            "status": "completed",
+            "governance_action": "ALLOW",
+            "result": result,
+            "trace_id": decision["trace_id"]
+        }
 
-        elif action == "RESTRICT":
-            # Handle with constraints/disclaimers
-            result = self._handle_with_restrictions(
-                user_input, intent, decision["rationale"]
-            )
-            return {
-                "status": "restricted",
-                "governance_action": "RESTRICT",
-                "result": result,
-                "rationale": decision["rationale"],
-                "trace_id": decision["trace_id"],
-                "final_gate": decision["final_gate"]
-            }
+    def _do_restrict(
+        self,
+        decision: Dict[str, Any],
+        user_input: str,
+        intent: str,
+        additional_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Handle with constraints/disclaimers."""
+        result = self._handle_with_restrictions(
+            user_input, intent, decision["rationale"]
+        )
+        return {
+            "status": "restricted",
+            "governance_action": "RESTRICT",
+            "result": result,
+            "rationale": decision["rationale"],
+            "trace_id": decision["trace_id"],
+            "final_gate": decision["final_gate"]
+        }
 
-        elif action == "ESCALATE":
-            # Escalate to human
-            ticket_id = self._escalate_to_human(
-                user_input, intent, decision["rationale"], decision["final_gate"]
-            )
-            return {
-                "status": "escalated",
-                "governance_action": "ESCALATE",
-                "ticket_id": ticket_id,
-                "rationale": decision["rationale"],
-                "trace_id": decision["trace_id"],
-                "final_gate": decision["final_gate"]
-            }
+    def _do_escalate(
+        self,
+        decision: Dict[str, Any],
+        user_input: str,
+        intent: str,
+        additional_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Escalate to human."""
+        ticket_id = self._escalate_to_human(
+            user_input, intent, decision["rationale"], decision["final_gate"]
+        )
+        return {
+            "status": "escalated",
+            "governance_action": "ESCALATE",
+            "ticket_id": ticket_id,
+            "rationale": decision["rationale"],
+            "trace_id": decision["trace_id"],
+            "final_gate": decision["final_gate"]
+        }
 
-        elif action == "STOP":
-            # Refuse to process
-            return {
-                "status": "refused",
-                "governance_action": "STOP",
-                "message": "I cannot process this request.",
-                "rationale": decision["rationale"],
-                "trace_id": decision["trace_id"],
-                "final_gate": decision["final_gate"]
-            }
+    def _do_stop(
+        self,
+        decision: Dict[str, Any],
+        user_input: str,
+        intent: str,
+        additional_context: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Refuse to process."""
+        return {
+            "status": "refused",
+            "governance_action": "STOP",
+            "message": "I cannot process this request.",
+            "rationale": decision["rationale"],
+            "trace_id": decision["trace_id"],
+            "final_gate": decision["final_gate"]
+        }
 
-        else:
-            # Unknown action - escalate for safety
-            return {
-                "status": "escalated",
-                "governance_action": "UNKNOWN",
-                "reason": f"Unknown governance action: {action}"
-            }
+    def _do_unknown(self, decision: Dict[str, Any]) -> Dict[str, Any]:
+        """Unknown action - escalate for safety."""
+        return {
+            "status": "escalated",
+            "governance_action": "UNKNOWN",
+            "reason": f"Unknown governance action: {decision['action']}"
+        }
 
     def _handle_normally(
         self,
@@ -265,7 +932,14 @@ class CustomerSupportAgent:
         """Escalate to human agent."""
 
         # TODO: Create ticket in your ticketing system
-        ticket_id = f"TICKET-{intent.upper()}-{hash(user_input) % 10000:04d}"
+        # Deterministic across processes (unlike hash()), so a retried request
+        # within the same hour maps to the same ticket and can be deduplicated
+        hour_bucket = int(time.time()) // 3600
+        digest = hashlib.blake2b(
+            f"{intent}\0{hour_bucket}\0{user_input}".encode("utf-8"), digest_size=4
+        ).digest()
+        prefix = _TICKET_PREFIX.get(intent) or f"TICKET-{intent.upper()}-"
+        ticket_id = f"{prefix}{int.from_bytes(digest, 'big') % 100000:05d}"
 
         # TODO: Notify human agents
         # For example: Slack notification, email, etc.
@@ -276,34 +950,40 @@ class CustomerSupportAgent:
         self,
         decision: Dict[str, Any],
         intent: str,
-        user_id: str
+        user_id: str,
+        cached: bool = False
     ):
-        """Log governance decision for observability."""
+        """Log governance decision for observability, including decisions served from the cache."""
 
         # TODO: Replace with your logging system
         # Example: structlog, loguru, or standard logging
 
+        if not LOG_DECISIONS:
+            return
+
+        get = decision.get
         log_entry = {
             "event": "governance_decision",
             "trace_id": decision["trace_id"],
             "intent": intent,
             "user_id": user_id,
+            "cached": cached,
             "decision": {
                 "action": decision["action"],
-                "final_gate": decision.get("final_gate"),
-                "decision_code": decision.get("decision_code"),
+                "final_gate": get("final_gate"),
+                "decision_code": get("decision_code"),
                 "rationale": decision["rationale"]
             },
             "telemetry": {
-                "latency_ms": decision.get("latency_ms"),
-                "policy_version": decision.get("policy_version"),
-                "policy_name": decision.get("policy_name")
+                "latency_ms": get("latency_ms"),
+                "policy_version": get("policy_version"),
+                "policy_name": get("policy_name")
             }
         }
 
-        # Example: structured JSON logging
-        import json
-        print(json.dumps(log_entry))
+        # Example: structured JSON logging, one line per decision on stderr,
+        # written off the request path
+        _enqueue_log(log_entry)
 
         # TODO: Send to your observability platform
         # - ELK / Splunk
@@ -311,9 +991,34 @@ class CustomerSupportAgent:
         # - DataDog / New Relic
 
 
+# Shared agent for long-running callers, so one Session, breaker and
+# decision cache serve the whole process instead of one per agent
+_DEFAULT_AGENT: Optional[CustomerSupportAgent] = None
+_DEFAULT_AGENT_LOCK = threading.Lock()
+
+
+def _close_default_agent() -> None:
+    """Close the pooled connections of the shared agent at interpreter exit."""
+    if _DEFAULT_AGENT is not None:
+        _DEFAULT_AGENT.session.close()
+        _DEFAULT_AGENT._probe_session.close()
+
+
+def get_default_agent() -> CustomerSupportAgent:
+    """Return the process-wide agent, creating it on first use."""
+    global _DEFAULT_AGENT
+
+    if _DEFAULT_AGENT is None:
+        with _DEFAULT_AGENT_LOCK:
+            if _DEFAULT_AGENT is None:
+                _DEFAULT_AGENT = CustomerSupportAgent()
+                atexit.register(_close_default_agent)
+    return _DEFAULT_AGENT
+
+
 # Example usage
 if __name__ == "__main__":
-    agent = CustomerSupportAgent()
+    agent = get_default_agent()
 
     # Example 1: Simple query (should ALLOW)
     result = agent.handle_request(
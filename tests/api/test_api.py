@@ -4,6 +4,7 @@ Tests for HTTP API.
 Tests the REST endpoints for governance decisions.
 """
 
+import importlib.util
 import sys
 import os
 from pathlib import Path
@@ -21,10 +22,20 @@ from fastapi.testclient import TestClient
 from governance_gate.api.main import app, POLICY_BASE_DIR
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def client():
-    """Create a test client."""
-    return TestClient(app)
+    """Create a test client shared by the session; startup runs once."""
+    # Run the app on uvloop when available, as the server does
+    backend_options = {"use_uvloop": True} if importlib.util.find_spec("uvloop") else None
+    with TestClient(app, backend_options=backend_options) as test_client:
+        yield test_client
+
+
+@pytest.fixture(autouse=True)
+def reset_dependency_overrides():
+    """Keep dependency overrides from leaking between tests on the shared app."""
+    yield
+    app.dependency_overrides.clear()
 
 
 @pytest.fixture
@@ -132,6 +143,36 @@ class TestDecisionEndpoint:
         assert data["policy_name"] is not None
         assert data["policy_version"] is not None
 
+    def test_decision_reuses_compiled_policy(self, client, sample_request):
+        """Test that repeated decisions share one evaluator per unchanged policy."""
+        from governance_gate.api import main
+
+        sample_request["policy_path"] = "customer_support.yaml"
+        key = str((Path(main.POLICY_BASE_DIR) / "customer_support.yaml").resolve())
+
+        first = client.post("/decision", json=sample_request).json()
+        evaluator = main._policy_evaluators[key][1]
+        sample_request["policy_path"] = "./././customer_support.yaml"
+        second = client.post("/decision", json=sample_request).json()
+
+        assert main._policy_evaluators[key][1] is evaluator
+        assert len(main._policy_evaluators) <= main.MAX_POLICY_EVALUATORS
+        assert second["action"] == first["action"]
+        assert second["trace_id"] != first["trace_id"]
+
+    def test_policy_evaluators_bounded(self, monkeypatch):
+        """Test that the least recently used evaluator is dropped past the bound."""
+        from governance_gate.api import main
+
+        monkeypatch.setattr(main, "_policy_evaluators", main.OrderedDict())
+        monkeypatch.setattr(main, "MAX_POLICY_EVALUATORS", 2)
+        policy = {"version": "1.0", "name": "bounded", "rules": []}
+
+        for name in ("a.yaml", "b.yaml", "c.yaml"):
+            main.get_policy_evaluator(Path(name), policy)
+
+        assert list(main._policy_evaluators) == [str(Path(name).resolve()) for name in ("b.yaml", "c.yaml")]
+
     def test_decision_invalid_policy(self, client, sample_request):
         """Test decision with invalid policy path."""
         sample_request["policy_path"] = "nonexistent.yaml"
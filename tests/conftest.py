@@ -5,14 +5,20 @@ Pytest fixtures and configuration.
 import pytest
 from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
 from governance_gate.core.pipeline import GovernancePipeline
-from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate
+from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate, SafetyGate
 from governance_gate.policy.loader import PolicyLoader
 from governance_gate.policy.evaluator import PolicyEvaluator
 from pathlib import Path
 
 
+# The fixtures below, except sample_pipeline, are session-scoped: Intent,
+# Context and Evidence are frozen, gates never mutate their inputs or their
+# own settings, and tests must not mutate the dicts they carry. Build a fresh object in the test if
+# it needs to change, or a local gate if it needs non-default settings.
+
+
 # Sample intent for testing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_intent():
     return Intent(
         name="order_status_query",
@@ -22,7 +28,7 @@ def sample_intent():
 
 
 # Sample context for testing
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_context():
     return Context(
         user_id="user_123",
@@ -32,7 +38,7 @@ def sample_context():
 
 
 # Evidence for ALLOW case
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evidence_allow():
     return Evidence(
         facts={
@@ -58,7 +64,7 @@ def evidence_allow():
 
 
 # Evidence for RESTRICT case (unverifiable facts)
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evidence_restrict_facts():
     return Evidence(
         facts={
@@ -81,7 +87,7 @@ def evidence_restrict_facts():
 
 
 # Evidence for RESTRICT case (low RAG confidence)
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evidence_restrict_rag():
     return Evidence(
         facts={
@@ -102,7 +108,7 @@ def evidence_restrict_rag():
 
 
 # Evidence for ESCALATE case (financial impact)
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evidence_escalate():
     return Evidence(
         facts={
@@ -124,7 +130,7 @@ def evidence_escalate():
 
 
 # Evidence for STOP case (conflicting retrieval)
-@pytest.fixture
+@pytest.fixture(scope="session")
 def evidence_stop():
     return Evidence(
         facts={
@@ -142,19 +148,42 @@ def evidence_stop():
     )
 
 
+# Gates with default settings
+@pytest.fixture(scope="session")
+def fact_gate():
+    return FactVerifiabilityGate()
+
+
+@pytest.fixture(scope="session")
+def uncertainty_gate():
+    return UncertaintyGate()
+
+
+@pytest.fixture(scope="session")
+def responsibility_gate():
+    return ResponsibilityGate()
+
+
+@pytest.fixture(scope="session")
+def safety_gate():
+    return SafetyGate()
+
+
+# Function-scoped and uncached, so no test is served results memoized by another
 @pytest.fixture
-def sample_pipeline():
+def sample_pipeline(fact_gate, uncertainty_gate, responsibility_gate):
     """Create a pipeline with all gates."""
     return GovernancePipeline(
         gates=[
-            FactVerifiabilityGate(),
-            UncertaintyGate(),
-            ResponsibilityGate(),
-        ]
+            fact_gate,
+            uncertainty_gate,
+            responsibility_gate,
+        ],
+        cache_size=0,
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def customer_support_policy():
     """Load the customer support policy."""
     policy_path = Path(__file__).parent.parent / "policies" / "presets" / "customer_support.yaml"
@@ -4,48 +4,49 @@ Integration tests for the governance pipeline.
 
 import pytest
 from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
-from governance_gate.core.pipeline import GovernancePipeline
-from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate
+from governance_gate.core.pipeline import DEFAULT_CACHE_SIZE, GovernancePipeline
+from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate, SafetyGate
 from governance_gate.policy.loader import PolicyLoader
 from governance_gate.policy.evaluator import PolicyEvaluator
 from pathlib import Path
 
+pytestmark = pytest.mark.integration
+
+
+# Evidence that passes every gate; tests derive their case from these
+BASE_FACTS = {
+    "verifiable": True,
+    "verifiable_confidence": 0.9,
+    "source": "database",
+    "freshness": "fresh",
+    "requires_realtime": False,
+}
+BASE_RAG = {
+    "confidence": 0.85,
+    "source": "vector_db",
+    "has_conflicts": False,
+    "conflict_count": 0,
+    "kb_version": "1.2.3",
+    "kb_age_days": 5,
+}
+BASE_TOPIC = {
+    "has_financial_impact": False,
+    "requires_authority": False,
+    "is_irreversible": False,
+    "is_sensitive": False,
+}
+
 
 class TestGovernancePipeline:
     """Integration tests for the full governance pipeline."""
 
-    def test_pipeline_with_all_gates_allow(self):
+    def test_pipeline_with_all_gates_allow(self, sample_pipeline):
         """Test pipeline with all gates passing."""
-        pipeline = GovernancePipeline(
-            gates=[
-                FactVerifiabilityGate(),
-                UncertaintyGate(),
-                ResponsibilityGate(),
-            ]
-        )
-
         intent = Intent(name="test_intent", confidence=0.95)
         context = Context(user_id="user_123", channel="web")
-        evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.9,
-                "source": "database",
-                "freshness": "fresh",
-            },
-            rag={
-                "confidence": 0.85,
-                "has_conflicts": False,
-                "kb_age_days": 5,
-            },
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-                "is_irreversible": False,
-            },
-        )
+        evidence = Evidence(facts=BASE_FACTS, rag=BASE_RAG, topic=BASE_TOPIC)
 
-        decision = pipeline.evaluate(intent, context, evidence)
+        decision = sample_pipeline.evaluate(intent, context, evidence)
 
         assert decision.action == DecisionAction.ALLOW
         assert decision.trace_id is not None
@@ -70,56 +71,36 @@ class TestGovernancePipeline:
         context = Context()
         evidence = Evidence(
             facts={
+                **BASE_FACTS,
                 "verifiable": False,
                 "verifiable_confidence": 0.4,
                 "source": "unknown",
                 "freshness": "stale",
                 "requires_realtime": True,
             },
-            rag={
-                "confidence": 0.85,
-                "has_conflicts": False,
-            },
-            topic={
-                "has_financial_impact": False,
-            },
+            rag=BASE_RAG,
+            topic=BASE_TOPIC,
         )
 
         decision = pipeline.evaluate(intent, context, evidence)
 
         assert decision.action == DecisionAction.RESTRICT
-        assert "verifiable" in decision.rationale.lower() or "real-time" in decision.rationale.lower()
+        # "verifiable" appears in every unverifiable-facts rationale, so check it first
+        rationale = decision.rationale.lower()
+        assert "verifiable" in rationale or "real-time" in rationale
         assert decision.final_gate == "fact_verifiability"
 
-    def test_pipeline_escalate_financial(self):
+    def test_pipeline_escalate_financial(self, sample_pipeline):
         """Test pipeline with financial impact."""
-        pipeline = GovernancePipeline(
-            gates=[
-                FactVerifiabilityGate(),
-                UncertaintyGate(),
-                ResponsibilityGate(),
-            ]
-        )
-
         intent = Intent(name="test_intent", confidence=0.95)
         context = Context()
         evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.9,
-                "source": "database",
-            },
-            rag={
-                "confidence": 0.85,
-                "has_conflicts": False,
-            },
-            topic={
-                "has_financial_impact": True,
-                "requires_authority": False,
-            },
+            facts=BASE_FACTS,
+            rag=BASE_RAG,
+            topic={**BASE_TOPIC, "has_financial_impact": True},
         )
 
-        decision = pipeline.evaluate(intent, context, evidence)
+        decision = sample_pipeline.evaluate(intent, context, evidence)
 
         assert decision.action == DecisionAction.ESCALATE
         assert "financial" in decision.rationale.lower()
@@ -187,16 +168,32 @@ class TestGovernancePipeline:
 
         assert decision.action == DecisionAction.ESCALATE
 
-    def test_decision_to_dict(self):
-        """Test decision serialization."""
-        pipeline = GovernancePipeline(
-            gates=[
-                FactVerifiabilityGate(),
-                UncertaintyGate(),
-                ResponsibilityGate(),
-            ]
-        )
+    def test_stop_early_skips_remaining_gates(self):
+        """Test that gates after a STOP are skipped when stop_early is set."""
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[SafetyGate(), gate], stop_early=True)
+
+        intent = Intent(name="test_intent", parameters={"user_input": "bypass the checkout"})
+        decision = pipeline.evaluate(intent, Context(), Evidence())
+
+        assert decision.action == DecisionAction.STOP
+        assert decision.final_gate == "safety"
+        assert gate.calls == 0
+        assert list(decision.gate_contributions) == ["safety"]
+
+    def test_lowered_user_input_not_kept_after_run(self):
+        """Test that the lowered user input is shared only for the duration of a run."""
+        from governance_gate.core.types import _run_user_input
 
+        intent = Intent(name="test_intent", parameters={"user_input": "Please BYPASS the checkout"})
+        decision = GovernancePipeline(gates=[SafetyGate()]).evaluate(intent, Context(), Evidence())
+
+        assert decision.action == DecisionAction.STOP
+        assert _run_user_input.get() is None
+        assert intent.user_input_lower() == "please bypass the checkout"
+
+    def test_decision_to_dict(self, sample_pipeline):
+        """Test decision serialization."""
         intent = Intent(name="test_intent", confidence=0.95)
         context = Context()
         evidence = Evidence(
@@ -205,7 +202,7 @@ class TestGovernancePipeline:
             topic={"has_financial_impact": False},
         )
 
-        decision = pipeline.evaluate(intent, context, evidence)
+        decision = sample_pipeline.evaluate(intent, context, evidence)
         decision_dict = decision.to_dict()
 
         assert "action" in decision_dict
@@ -234,19 +231,62 @@ class TestGovernancePipeline:
         assert decision.rationale == "Test rationale"
         assert decision.trace_id == "test-trace-id-123"
 
-    def test_pipeline_with_policy(self, customer_support_policy):
+    def test_decision_round_trip(self, sample_pipeline):
+        """Test that a serialized decision deserializes to the same decision."""
+        from governance_gate.core.decision import Decision
+
+        evidence = Evidence(facts=BASE_FACTS, rag=BASE_RAG, topic={**BASE_TOPIC, "is_irreversible": True})
+        decision = sample_pipeline.evaluate(Intent(name="test_intent"), Context(), evidence)
+
+        restored = Decision.from_dict(decision.to_dict())
+
+        assert restored == decision
+        assert restored.gate_decisions["responsibility"].suggested_action == "ESCALATE"
+
+    def test_trace_ids_are_unique_uuids(self):
+        """Test that generated trace IDs are distinct and parse as version 4 UUIDs."""
+        import uuid
+        from governance_gate.core.decision import generate_trace_id
+
+        trace_ids = [generate_trace_id() for _ in range(100)] + [generate_trace_id(strict=True)]
+
+        assert len(set(trace_ids)) == len(trace_ids)
+        assert all(uuid.UUID(trace_id).version == 4 for trace_id in trace_ids)
+
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_evaluate_many_matches_evaluate(self, sample_pipeline, max_workers):
+        """Test that batch evaluation gives the same decisions as one-by-one evaluation."""
+        records = [
+            (
+                Intent(name="test_intent"),
+                Context(),
+                Evidence(facts=BASE_FACTS, rag={**BASE_RAG, "confidence": confidence}, topic=topic),
+            )
+            for confidence in (0.9, 0.3)
+            for topic in (BASE_TOPIC, {**BASE_TOPIC, "has_financial_impact": True})
+        ] * 20
+
+        def outcome(decision):
+            return decision.action, decision.final_gate, decision.decision_code, decision.gate_contributions
+
+        decisions = sample_pipeline.evaluate_many(records, max_workers=max_workers)
+
+        assert [outcome(decision) for decision in decisions] == [
+            outcome(sample_pipeline.evaluate(*record)) for record in records
+        ]
+        assert [decision.action for decision in decisions[:4]] == [
+            DecisionAction.ALLOW,
+            DecisionAction.ESCALATE,
+            DecisionAction.RESTRICT,
+            DecisionAction.ESCALATE,
+        ]
+        assert len({decision.trace_id for decision in decisions}) == len(records)
+
+    def test_pipeline_with_policy(self, sample_pipeline, customer_support_policy):
         """Test pipeline with policy evaluator."""
         if not customer_support_policy:
             pytest.skip("Customer support policy not found")
 
-        pipeline = GovernancePipeline(
-            gates=[
-                FactVerifiabilityGate(),
-                UncertaintyGate(),
-                ResponsibilityGate(),
-            ]
-        )
-
         intent = Intent(
             name="order_status_query",
             confidence=0.95,
@@ -259,121 +299,201 @@ class TestGovernancePipeline:
             topic={"has_financial_impact": False},
         )
 
-        decision = pipeline.evaluate(intent, context, evidence, customer_support_policy)
+        decision = sample_pipeline.evaluate(intent, context, evidence, customer_support_policy)
 
         # Should be ALLOW based on policy rules
         assert decision.action == DecisionAction.ALLOW
 
+    def test_shared_gate_reports_each_policy_config(self):
+        """Test that a gate shared across policies and threads reports the config it used."""
+        from concurrent.futures import ThreadPoolExecutor
 
-class TestCustomerSupportExamples:
-    """Test the customer support example cases."""
+        gate = UncertaintyGate()
+        pipeline = GovernancePipeline(gates=[gate])
+        policies = [
+            PolicyEvaluator({"rules": [], "gates": {"uncertainty": {"confidence_threshold": threshold}}})
+            for threshold in (0.5, 0.9)
+        ]
+        evidence = Evidence(rag={**BASE_RAG, "confidence": 0.7})
 
-    def test_case_01_allow(self, sample_pipeline):
-        """Test case 01: ALLOW - rule explanation only."""
-        intent = Intent(
-            name="order_status_query",
-            confidence=0.95,
-            parameters={"user_input": "How do I check my order status?"},
-        )
-        context = Context(user_id="user_123", channel="web")
-        evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.9,
-                "source": "database",
-                "freshness": "fresh",
-                "requires_realtime": False,
-            },
-            rag={
-                "confidence": 0.85,
-                "source": "vector_db",
-                "has_conflicts": False,
-                "conflict_count": 0,
-                "kb_version": "1.2.3",
-                "kb_age_days": 5,
-            },
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            },
+        def run(policy):
+            decision = pipeline.evaluate(Intent(name="test_intent"), Context(), evidence, policy)
+            return decision.action, decision.gate_decisions[gate.name].config_used["confidence_threshold"]
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            outcomes = list(pool.map(run, policies * 200))
+
+        assert outcomes == [(DecisionAction.ALLOW, 0.5), (DecisionAction.RESTRICT, 0.9)] * 200
+
+    def test_legacy_config_snapshot_override(self):
+        """Test that get_config_snapshot overrides without a policy argument still work."""
+
+        class LegacyGate(ResponsibilityGate):
+            def get_config_snapshot(self):
+                return {"legacy": True}
+
+        decision = GovernancePipeline(gates=[LegacyGate()]).evaluate(
+            Intent(name="test_intent"), Context(), Evidence()
         )
 
-        decision = sample_pipeline.evaluate(intent, context, evidence)
+        assert decision.gate_decisions["responsibility"].config_used == {"legacy": True}
 
-        assert decision.action == DecisionAction.ALLOW
 
-    def test_case_02_restrict(self, sample_pipeline):
-        """Test case 02: RESTRICT - depends on real-time facts."""
-        intent = Intent(
-            name="order_status_query",
-            confidence=0.92,
-            parameters={"user_input": "Why has my order not shipped yet?"},
+class CountingGate(ResponsibilityGate):
+    """ResponsibilityGate that counts its evaluations."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    def evaluate(self, intent, context, evidence, policy=None):
+        self.calls += 1
+        return super().evaluate(intent, context, evidence, policy)
+
+
+class TestGovernancePipelineCache:
+    """Tests for memoized gate results in the pipeline."""
+
+    def test_repeated_inputs_skip_gate_evaluation(self):
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[FactVerifiabilityGate(), gate], cache_size=DEFAULT_CACHE_SIZE)
+
+        first = pipeline.evaluate(
+            Intent(name="refund"), Context(user_id="a"), Evidence(facts={"verifiable": True})
         )
-        context = Context(user_id="user_123", channel="web")
-        evidence = Evidence(
-            facts={
-                "verifiable": False,
-                "verifiable_confidence": 0.4,
-                "source": "unknown",
-                "freshness": "stale",
-                "requires_realtime": True,
-            },
-            rag={
-                "confidence": 0.85,
-                "source": "vector_db",
-                "has_conflicts": False,
-                "conflict_count": 0,
-                "kb_version": "1.2.3",
-                "kb_age_days": 5,
-            },
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            },
+        second = pipeline.evaluate(
+            Intent(name="refund"), Context(user_id="b"), Evidence(facts={"verifiable": True})
         )
 
-        decision = sample_pipeline.evaluate(intent, context, evidence)
+        assert gate.calls == 1
+        assert second.trace_id != first.trace_id
+        assert second.evidence_summary["context"]["user_id"] == "b"
+        assert second.action == first.action == DecisionAction.ESCALATE
+        assert second.decision_code == first.decision_code
+        assert second.gate_contributions == first.gate_contributions
 
-        assert decision.action == DecisionAction.RESTRICT
-        assert "real-time" in decision.rationale.lower() or "verifiable" in decision.rationale.lower()
+    def test_used_field_change_reevaluates(self):
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[gate], cache_size=DEFAULT_CACHE_SIZE)
+
+        allowed = pipeline.evaluate(Intent(name="q"), Context(), Evidence(topic={"is_irreversible": 0}))
+        escalated = pipeline.evaluate(Intent(name="q"), Context(), Evidence(topic={"is_irreversible": True}))
+
+        assert gate.calls == 2
+        assert allowed.action == DecisionAction.ALLOW
+        assert escalated.action == DecisionAction.ESCALATE
+
+    def test_other_gates_field_change_reuses_gate_result(self):
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[UncertaintyGate(), gate], cache_size=DEFAULT_CACHE_SIZE)
+
+        confident = pipeline.evaluate(Intent(name="q"), Context(), Evidence(rag={"confidence": 0.9}))
+        uncertain = pipeline.evaluate(Intent(name="q"), Context(), Evidence(rag={"confidence": 0.1}))
+
+        assert gate.calls == 1
+        assert confident.gate_contributions[gate.name] == uncertain.gate_contributions[gate.name]
+        assert confident.action != uncertain.action
+
+    def test_cache_is_off_by_default(self):
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[gate])
+
+        pipeline.evaluate(Intent(name="q"), Context(), Evidence())
+        pipeline.evaluate(Intent(name="q"), Context(), Evidence())
+
+        assert gate.calls == 2
+        assert len(pipeline._cache) == len(pipeline._gate_cache) == 0
+
+    def test_cached_results_do_not_share_mutable_payloads(self):
+        gate = CountingGate()
+        pipeline = GovernancePipeline(gates=[gate], cache_size=DEFAULT_CACHE_SIZE)
+
+        first = pipeline.evaluate(Intent(name="q"), Context(), Evidence(topic={"is_irreversible": False}))
+        first.gate_decisions[gate.name].config_used["financial_intents"].append("leaked")
+        first.gate_decisions[gate.name].input_summary["topic"]["leaked"] = True
+        second = pipeline.evaluate(Intent(name="q"), Context(), Evidence(topic={"is_irreversible": False}))
+        second.gate_decisions[gate.name].config_used["financial_intents"].append("leaked")
+        third = pipeline.evaluate(Intent(name="q"), Context(), Evidence(topic={"is_irreversible": False}))
+
+        assert gate.calls == 1
+        for decision in (second, third):
+            gate_decision = decision.gate_decisions[gate.name]
+            assert gate_decision.config_used["financial_intents"].count("leaked") == (decision is second)
+            assert "leaked" not in gate_decision.input_summary["topic"]
 
-    def test_case_03_escalate(self, sample_pipeline):
-        """Test case 03: ESCALATE - financial responsibility."""
+    def test_gate_without_used_fields_disables_cache(self):
+        gate = CountingGate()
+        gate.USED_FIELDS = None
+        pipeline = GovernancePipeline(gates=[gate], cache_size=DEFAULT_CACHE_SIZE)
+
+        pipeline.evaluate(Intent(name="q"), Context(), Evidence())
+        pipeline.evaluate(Intent(name="q"), Context(), Evidence())
+
+        assert gate.calls == 2
+        assert len(pipeline._cache) == 0
+
+
+class TestCustomerSupportExamples:
+    """Test the customer support example cases."""
+
+    @pytest.mark.parametrize(
+        "confidence, user_input, facts, rag, topic, expected_action, rationale_terms",
+        [
+            # Case 01: ALLOW - rule explanation only
+            (
+                0.95,
+                "How do I check my order status?",
+                BASE_FACTS,
+                BASE_RAG,
+                BASE_TOPIC,
+                DecisionAction.ALLOW,
+                (),
+            ),
+            # Case 02: RESTRICT - depends on real-time facts
+            (
+                0.92,
+                "Why has my order not shipped yet?",
+                {
+                    **BASE_FACTS,
+                    "verifiable": False,
+                    "verifiable_confidence": 0.4,
+                    "source": "unknown",
+                    "freshness": "stale",
+                    "requires_realtime": True,
+                },
+                BASE_RAG,
+                BASE_TOPIC,
+                DecisionAction.RESTRICT,
+                ("verifiable", "real-time"),
+            ),
+            # Case 03: ESCALATE - financial responsibility
+            (
+                0.90,
+                "You messed up my order, you should compensate me",
+                {**BASE_FACTS, "verifiable_confidence": 0.85},
+                {**BASE_RAG, "confidence": 0.80},
+                {**BASE_TOPIC, "has_financial_impact": True},
+                DecisionAction.ESCALATE,
+                ("financial",),
+            ),
+        ],
+        ids=["case_01_allow", "case_02_restrict", "case_03_escalate"],
+    )
+    def test_case(
+        self, sample_pipeline, confidence, user_input, facts, rag, topic, expected_action, rationale_terms
+    ):
+        """Test a customer support case against its expected action and rationale."""
         intent = Intent(
             name="order_status_query",
-            confidence=0.90,
-            parameters={"user_input": "You messed up my order, you should compensate me"},
+            confidence=confidence,
+            parameters={"user_input": user_input},
         )
         context = Context(user_id="user_123", channel="web")
-        evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.85,
-                "source": "database",
-                "freshness": "fresh",
-                "requires_realtime": False,
-            },
-            rag={
-                "confidence": 0.80,
-                "source": "vector_db",
-                "has_conflicts": False,
-                "conflict_count": 0,
-                "kb_version": "1.2.3",
-                "kb_age_days": 5,
-            },
-            topic={
-                "has_financial_impact": True,
-                "requires_authority": False,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            },
-        )
+        evidence = Evidence(facts=facts, rag=rag, topic=topic)
 
         decision = sample_pipeline.evaluate(intent, context, evidence)
 
-        assert decision.action == DecisionAction.ESCALATE
-        assert "financial" in decision.rationale.lower()
+        assert decision.action == expected_action
+        if rationale_terms:
+            rationale = decision.rationale.lower()
+            assert any(term in rationale for term in rationale_terms)
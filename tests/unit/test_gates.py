@@ -6,291 +6,276 @@ import pytest
 from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
 from governance_gate.gates import FactVerifiabilityGate, UncertaintyGate, ResponsibilityGate
 
+pytestmark = pytest.mark.unit
+
+
+# Evidence that passes every gate; tests derive their case from these
+BASE_FACTS = {
+    "verifiable": True,
+    "verifiable_confidence": 0.9,
+    "source": "database",
+    "freshness": "fresh",
+}
+BASE_RAG = {
+    "confidence": 0.85,
+    "source": "vector_db",
+    "has_conflicts": False,
+    "kb_age_days": 5,
+}
+BASE_TOPIC = {
+    "has_financial_impact": False,
+    "requires_authority": False,
+    "is_irreversible": False,
+    "is_sensitive": False,
+}
+
+INTENT = Intent(name="test_intent", confidence=1.0)
+
 
 class TestFactVerifiabilityGate:
     """Tests for FactVerifiabilityGate."""
 
-    def test_name(self):
-        gate = FactVerifiabilityGate()
-        assert gate.name == "fact_verifiability"
-
-    def test_verifiable_facts_allow(self):
-        gate = FactVerifiabilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.9,
-                "source": "database",
-                "freshness": "fresh",
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action is None  # No override
-        assert "verifiable" in rationale.lower()
-
-    def test_unverifiable_realtime_facts_restrict(self):
-        gate = FactVerifiabilityGate(require_realtime_facts=["test_intent"])
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            facts={
-                "verifiable": False,
-                "verifiable_confidence": 0.3,
-                "source": "unknown",
-                "freshness": "stale",
-                "requires_realtime": True,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.RESTRICT
-        assert "real-time" in rationale.lower() or "verifiable" in rationale.lower()
-
-    def test_low_confidence_restrict(self):
-        gate = FactVerifiabilityGate(verifiable_threshold=0.7)
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            facts={
-                "verifiable": True,
-                "verifiable_confidence": 0.5,
-                "source": "database",
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        # Should not restrict since no realtime requirement
-        assert action is None
-        assert "confidence" in rationale.lower()
-
-    def test_stale_facts_restrict(self):
-        gate = FactVerifiabilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            facts={
+    def test_name(self, fact_gate):
+        assert fact_gate.name == "fact_verifiability"
+
+    @pytest.mark.parametrize(
+        "gate_kwargs, facts_override, expected_action, rationale_substr",
+        [
+            pytest.param({}, {}, None, "verifiable", id="verifiable_allow"),
+            pytest.param(
+                {"require_realtime_facts": ["test_intent"]},
+                {
+                    "verifiable": False,
+                    "verifiable_confidence": 0.3,
+                    "source": "unknown",
+                    "freshness": "stale",
+                    "requires_realtime": True,
+                },
+                DecisionAction.RESTRICT,
+                "real-time",
+                id="unverifiable_realtime_restrict",
+            ),
+            # Not restricted without a real-time requirement
+            pytest.param(
+                {"verifiable_threshold": 0.7},
+                {"verifiable_confidence": 0.5},
+                None,
+                "confidence",
+                id="low_confidence",
+            ),
+            pytest.param(
+                {"verifiable_threshold": 0.4},
+                {"verifiable_confidence": 0.5},
+                None,
+                "facts are verifiable",
+                id="lowered_threshold_allow",
+            ),
+            pytest.param({}, {"freshness": "stale"}, DecisionAction.RESTRICT, "stale", id="stale_restrict"),
+        ],
+    )
+    def test_evaluate(self, gate_kwargs, facts_override, expected_action, rationale_substr):
+        gate = FactVerifiabilityGate(**gate_kwargs)
+        evidence = Evidence(facts={**BASE_FACTS, **facts_override})
+
+        action, rationale = gate.evaluate(INTENT, Context(), evidence)
+
+        assert action == expected_action
+        assert rationale_substr in rationale.lower()
+
+    def test_input_summary_reports_verifiable_flag(self, fact_gate):
+        evidence = Evidence(facts={"verifiable": True, "source": "database", "account_id": "a-1"})
+
+        assert fact_gate.get_input_summary(evidence) == {
+            "facts": {
                 "verifiable": True,
+                "verifiable_confidence": None,
                 "source": "database",
-                "freshness": "stale",
+                "freshness": None,
+                "requires_realtime": None,
             }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.RESTRICT
-        assert "stale" in rationale.lower()
+        }
 
 
 class TestUncertaintyGate:
     """Tests for UncertaintyGate."""
 
-    def test_name(self):
-        gate = UncertaintyGate()
-        assert gate.name == "uncertainty"
+    def test_name(self, uncertainty_gate):
+        assert uncertainty_gate.name == "uncertainty"
+
+    @pytest.mark.parametrize(
+        "gate_kwargs, rag_override, expected_action, rationale_substr",
+        [
+            pytest.param({"confidence_threshold": 0.6}, {}, None, "acceptable", id="high_confidence_allow"),
+            pytest.param(
+                {"confidence_threshold": 0.6},
+                {"confidence": 0.4},
+                DecisionAction.RESTRICT,
+                "threshold",
+                id="low_confidence_restrict",
+            ),
+            pytest.param(
+                {"confidence_threshold": 0.3},
+                {"confidence": 0.4},
+                None,
+                "acceptable",
+                id="lowered_threshold_allow",
+            ),
+            pytest.param(
+                {},
+                {"has_conflicts": True, "conflict_count": 2},
+                DecisionAction.RESTRICT,
+                "conflict",
+                id="conflicting_results_restrict",
+            ),
+            pytest.param(
+                {"outdated_version_days": 30},
+                {"kb_version": "1.0.0", "kb_age_days": 45},
+                DecisionAction.RESTRICT,
+                "outdated",
+                id="outdated_knowledge_restrict",
+            ),
+            pytest.param(
+                {"outdated_version_days": 60},
+                {"kb_version": "1.0.0", "kb_age_days": 45},
+                None,
+                "acceptable",
+                id="longer_outdated_window_allow",
+            ),
+            pytest.param(
+                {},
+                {"tool_disagreement": True},
+                DecisionAction.ESCALATE,
+                "human review",
+                id="tool_disagreement_escalate",
+            ),
+        ],
+    )
+    def test_evaluate(self, gate_kwargs, rag_override, expected_action, rationale_substr):
+        gate = UncertaintyGate(**gate_kwargs)
+        evidence = Evidence(rag={**BASE_RAG, **rag_override})
+
+        action, rationale = gate.evaluate(INTENT, Context(), evidence)
+
+        assert action == expected_action
+        assert rationale_substr in rationale.lower()
+
+    def test_policy_config_does_not_mutate_gate(self):
+        from governance_gate.policy.evaluator import PolicyEvaluator
 
-    def test_high_confidence_allow(self):
         gate = UncertaintyGate(confidence_threshold=0.6)
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            rag={
-                "confidence": 0.85,
-                "source": "vector_db",
-                "has_conflicts": False,
-                "kb_age_days": 5,
-            }
+        policy = PolicyEvaluator(
+            {"rules": [], "gates": {"uncertainty": {"confidence_threshold": 0.9}}}
         )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action is None
-        assert "acceptable" in rationale.lower()
-
-    def test_low_confidence_restrict(self):
-        gate = UncertaintyGate(confidence_threshold=0.6)
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            rag={
-                "confidence": 0.4,
-                "source": "vector_db",
-                "has_conflicts": False,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.RESTRICT
-        assert "confidence" in rationale.lower() or "threshold" in rationale.lower()
-
-    def test_conflicting_results_restrict(self):
-        gate = UncertaintyGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            rag={
-                "confidence": 0.8,
-                "has_conflicts": True,
-                "conflict_count": 2,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.RESTRICT
-        assert "conflict" in rationale.lower()
-
-    def test_outdated_knowledge_restrict(self):
-        gate = UncertaintyGate(outdated_version_days=30)
         intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            rag={
-                "confidence": 0.8,
-                "kb_version": "1.0.0",
-                "kb_age_days": 45,
-            }
-        )
+        evidence = Evidence(rag={"confidence": 0.8})
 
-        action, rationale = gate.evaluate(intent, context, evidence)
+        action, _ = gate.evaluate(intent, Context(), evidence, policy)
 
         assert action == DecisionAction.RESTRICT
-        assert "outdated" in rationale.lower() or "old" in rationale.lower()
-
-    def test_tool_disagreement_escalate(self):
-        gate = UncertaintyGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            rag={
-                "confidence": 0.8,
-                "tool_disagreement": True,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.ESCALATE
-        assert "human" in rationale.lower() or "review" in rationale.lower()
+        assert gate.get_config_snapshot(policy)["confidence_threshold"] == 0.9
+        assert gate.get_config_snapshot()["confidence_threshold"] == 0.6
+        assert gate.confidence_threshold == 0.6
+        assert gate.evaluate(intent, Context(), evidence)[0] is None
 
 
 class TestResponsibilityGate:
     """Tests for ResponsibilityGate."""
 
-    def test_name(self):
-        gate = ResponsibilityGate()
-        assert gate.name == "responsibility"
-
-    def test_within_boundaries_allow(self):
-        gate = ResponsibilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action is None
-        assert "boundaries" in rationale.lower()
-
-    def test_financial_impact_escalate(self):
-        gate = ResponsibilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": True,
-                "requires_authority": False,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.ESCALATE
-        assert "financial" in rationale.lower() or "responsibility" in rationale.lower()
+    def test_name(self, responsibility_gate):
+        assert responsibility_gate.name == "responsibility"
+
+    @pytest.mark.parametrize(
+        "intent, topic_override, expected_action, rationale_substr",
+        [
+            pytest.param(INTENT, {}, None, "boundaries", id="within_boundaries_allow"),
+            pytest.param(
+                INTENT,
+                {"has_financial_impact": True},
+                DecisionAction.ESCALATE,
+                "financial",
+                id="financial_impact_escalate",
+            ),
+            pytest.param(
+                Intent(name="refund", confidence=1.0),
+                {},
+                DecisionAction.ESCALATE,
+                "financial",
+                id="financial_intent_escalate",
+            ),
+            pytest.param(
+                INTENT,
+                {"requires_authority": True},
+                DecisionAction.ESCALATE,
+                "authority",
+                id="authority_required_escalate",
+            ),
+            pytest.param(
+                INTENT,
+                {"is_irreversible": True},
+                DecisionAction.ESCALATE,
+                "irreversible",
+                id="irreversible_escalate",
+            ),
+            pytest.param(
+                Intent(
+                    name="test_intent",
+                    confidence=1.0,
+                    parameters={"user_input": "You should compensate me for this issue"},
+                ),
+                {},
+                DecisionAction.ESCALATE,
+                "compensation",
+                id="compensation_keywords_escalate",
+            ),
+        ],
+    )
+    def test_evaluate(self, responsibility_gate, intent, topic_override, expected_action, rationale_substr):
+        evidence = Evidence(topic={**BASE_TOPIC, **topic_override})
+
+        action, rationale = responsibility_gate.evaluate(intent, Context(), evidence)
+
+        assert action == expected_action
+        assert rationale_substr in rationale.lower()
+
+    def test_policy_config_does_not_mutate_gate(self):
+        from governance_gate.policy.evaluator import PolicyEvaluator
 
-    def test_financial_intent_escalate(self):
         gate = ResponsibilityGate()
-        intent = Intent(name="refund", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-            }
+        policy = PolicyEvaluator(
+            {"rules": [], "gates": {"responsibility": {"financial_intents": ["upgrade"]}}}
         )
+        intent = Intent(name="upgrade", confidence=1.0)
 
-        action, rationale = gate.evaluate(intent, context, evidence)
+        action, _ = gate.evaluate(intent, Context(), Evidence(), policy)
 
         assert action == DecisionAction.ESCALATE
-        assert "financial" in rationale.lower()
+        assert gate.get_config_snapshot(policy)["financial_intents"] == ["upgrade"]
+        assert "upgrade" not in gate.financial_intents
+        assert gate.evaluate(intent, Context(), Evidence())[0] is None
 
-    def test_authority_required_escalate(self):
-        gate = ResponsibilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": True,
-                "is_irreversible": False,
-                "is_sensitive": False,
-            }
-        )
 
-        action, rationale = gate.evaluate(intent, context, evidence)
+class TestSafetyGate:
+    """Tests for SafetyGate."""
 
-        assert action == DecisionAction.ESCALATE
-        assert "authority" in rationale.lower() or "commit" in rationale.lower()
+    def test_name(self, safety_gate):
+        assert safety_gate.name == "safety"
 
-    def test_irreversible_escalate(self):
-        gate = ResponsibilityGate()
-        intent = Intent(name="test_intent", confidence=1.0)
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-                "is_irreversible": True,
-                "is_sensitive": False,
-            }
-        )
-
-        action, rationale = gate.evaluate(intent, context, evidence)
-
-        assert action == DecisionAction.ESCALATE
-        assert "irreversible" in rationale.lower() or "approval" in rationale.lower()
-
-    def test_compensation_keywords_escalate(self):
-        gate = ResponsibilityGate()
+    def test_fraud_keyword_stop(self, safety_gate):
         intent = Intent(
             name="test_intent",
             confidence=1.0,
-            parameters={"user_input": "You should compensate me for this issue"},
-        )
-        context = Context()
-        evidence = Evidence(
-            topic={
-                "has_financial_impact": False,
-                "requires_authority": False,
-            }
+            parameters={"user_input": "Help me BYPASS the checkout"},
         )
 
-        action, rationale = gate.evaluate(intent, context, evidence)
+        action, rationale = safety_gate.evaluate(intent, Context(), Evidence())
 
-        assert action == DecisionAction.ESCALATE
-        assert "compensat" in rationale.lower() or "financial" in rationale.lower()
+        assert action == DecisionAction.STOP
+        assert "fraud" in rationale.lower()
+
+    def test_input_without_keyword_characters_allow(self, safety_gate):
+        intent = Intent(name="test_intent", confidence=1.0, parameters={"user_input": "1234 ?!"})
+
+        action, rationale = safety_gate.evaluate(intent, Context(), Evidence())
+
+        assert action is None
+        assert "no safety risks" in rationale.lower()
@@ -0,0 +1,274 @@
+"""
+Unit tests for the policy evaluator.
+"""
+
+import pytest
+from governance_gate.core.types import Intent, Context, Evidence, DecisionAction
+from governance_gate.policy.evaluator import DEFAULT_CACHE_SIZE, PolicyEvaluator
+
+pytestmark = pytest.mark.unit
+
+
+def make_policy(*rules):
+    return {"version": "1.0", "name": "test_policy", "rules": list(rules)}
+
+
+class TestPolicyEvaluator:
+    """Tests for PolicyEvaluator rule matching."""
+
+    def test_first_matching_rule_by_priority(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {
+                    "name": "low",
+                    "conditions": {"intent.name": {"equals": "refund"}},
+                    "action": "RESTRICT",
+                },
+                {
+                    "name": "high",
+                    "priority": 10,
+                    "conditions": {"intent.name": {"equals": "refund"}},
+                    "action": "ESCALATE",
+                    "reason": "Refunds need review",
+                },
+            )
+        )
+
+        action, reason = evaluator.evaluate(Intent(name="refund"), Context(), Evidence())
+
+        assert action == DecisionAction.ESCALATE
+        assert reason == "Refunds need review"
+
+    def test_equal_priority_keeps_file_order(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {"name": "first", "conditions": {}, "action": "RESTRICT"},
+                {"name": "second", "conditions": {}, "action": "STOP"},
+            )
+        )
+
+        action, reason = evaluator.evaluate(Intent(name="any"), Context(), Evidence())
+
+        assert action == DecisionAction.RESTRICT
+        assert reason == "Matched rule: first"
+
+    def test_disabled_rule_skipped(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {"name": "off", "enabled": False, "conditions": {}, "action": "STOP"},
+            )
+        )
+
+        action, reason = evaluator.evaluate(Intent(name="any"), Context(), Evidence())
+
+        assert action is None
+        assert reason == "No policy rules matched"
+
+    def test_all_conditions_must_match(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {
+                    "name": "low_confidence_web",
+                    "conditions": {
+                        "context.channel": {"in": ["web", "chat"]},
+                        "evidence.rag.confidence": {"lt": 0.5},
+                    },
+                    "action": "RESTRICT",
+                },
+            )
+        )
+
+        matched, _ = evaluator.evaluate(
+            Intent(name="q"), Context(channel="web"), Evidence(rag={"confidence": 0.3})
+        )
+        unmatched, _ = evaluator.evaluate(
+            Intent(name="q"), Context(channel="email"), Evidence(rag={"confidence": 0.3})
+        )
+
+        assert matched == DecisionAction.RESTRICT
+        assert unmatched is None
+
+    @pytest.mark.parametrize(
+        "condition, value, expected",
+        [
+            ({"equals": "a"}, "a", True),
+            ({"not_equals": "a"}, "a", False),
+            ({"in": ["a", "b"]}, "b", True),
+            ({"not_in": ["a", "b"]}, "c", True),
+            ({"contains": "fund"}, "refund", True),
+            ({"not_contains": "x"}, ["a", "b"], True),
+            ({"any_of": ["a", "z"]}, ["a", "b"], True),
+            ({"all_of": ["a", "z"]}, ["a", "b"], False),
+            ({"gt": 1}, 2, True),
+            ({"gte": 2}, 2, True),
+            ({"lt": 1}, "0", False),
+            ({"lte": 1}, 1.0, True),
+            ({"between": [1, 3]}, 2, True),
+            ({"is_true": True}, True, True),
+            ({"is_false": True}, 0, False),
+            ({"is_null": True}, None, True),
+            ({"is_not_null": True}, None, False),
+            ({"matches": "^ref"}, "refund", True),
+            ({"starts_with": "re"}, "refund", True),
+            ({"ends_with": "und"}, "refund", True),
+            ({"unknown_operator": 1}, 1, False),
+        ],
+    )
+    def test_operators(self, condition, value, expected):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {
+                    "name": "operator_rule",
+                    "conditions": {"evidence.facts.value": condition},
+                    "action": "STOP",
+                },
+            )
+        )
+
+        action, _ = evaluator.evaluate(Intent(name="q"), Context(), Evidence(facts={"value": value}))
+
+        assert (action == DecisionAction.STOP) is expected
+
+    def test_context_metadata_is_flattened(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {
+                    "name": "vip",
+                    "conditions": {"context.tier": {"equals": "vip"}},
+                    "action": "ALLOW",
+                },
+            )
+        )
+
+        action, _ = evaluator.evaluate(Intent(name="q"), Context(metadata={"tier": "vip"}), Evidence())
+
+        assert action == DecisionAction.ALLOW
+
+    def test_rules_indexed_by_intent_and_channel(self):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {"name": "refund", "conditions": {"intent.name": {"equals": "refund"}}, "action": "ESCALATE"},
+                {"name": "phone", "conditions": {"context.channel": {"in": ["phone"]}}, "action": "RESTRICT"},
+                {"name": "fallback", "conditions": {}, "action": "ALLOW"},
+            )
+        )
+
+        assert [rule.name for rule in evaluator._unindexed] == ["fallback"]
+        assert evaluator.evaluate(Intent(name="refund"), Context(channel="phone"), Evidence())[0] == (
+            DecisionAction.ESCALATE
+        )
+        assert evaluator.evaluate(Intent(name="q"), Context(channel="phone"), Evidence())[0] == (
+            DecisionAction.RESTRICT
+        )
+        # Metadata overrides the channel field, for the index as for conditions
+        assert evaluator.evaluate(
+            Intent(name="q"), Context(channel="web", metadata={"channel": "phone"}), Evidence()
+        )[0] == DecisionAction.RESTRICT
+        assert evaluator.evaluate(Intent(name="q"), Context(channel="web"), Evidence())[0] == (
+            DecisionAction.ALLOW
+        )
+
+
+class TestPolicyEvaluatorCache:
+    """Tests for memoized policy evaluation."""
+
+    def make_evaluator(self, cache_size=DEFAULT_CACHE_SIZE):
+        return PolicyEvaluator(
+            make_policy(
+                {
+                    "name": "verified_only",
+                    "conditions": {"evidence.facts.verifiable": {"is_true": True}},
+                    "action": "ALLOW",
+                },
+            ),
+            cache_size=cache_size,
+        )
+
+    def test_cache_disabled_by_default(self):
+        evaluator = PolicyEvaluator(make_policy())
+
+        evaluator.evaluate(Intent(name="q"), Context(), Evidence())
+
+        assert evaluator.cache_size == 0
+        assert len(evaluator._cache) == 0
+
+    def test_repeated_evaluation_is_cached(self):
+        evaluator = self.make_evaluator()
+        evidence = Evidence(facts={"verifiable": True})
+
+        first = evaluator.evaluate(Intent(name="q"), Context(), evidence)
+        second = evaluator.evaluate(Intent(name="q"), Context(), evidence)
+
+        assert first == second == (DecisionAction.ALLOW, "Matched rule: verified_only")
+        assert len(evaluator._cache) == 1
+
+    def test_cache_keyed_on_referenced_fields_only(self):
+        evaluator = self.make_evaluator()
+
+        for session_id in ("s-1", "s-2"):
+            action, _ = evaluator.evaluate(
+                Intent(name="q", parameters={"user_input": session_id}),
+                Context(user_id="u-1", session_id=session_id, metadata={"request_id": session_id}),
+                Evidence(facts={"verifiable": True, "account": session_id}),
+            )
+            assert action == DecisionAction.ALLOW
+
+        assert len(evaluator._cache) == 1
+        assert "s-1" not in repr(list(evaluator._cache))
+
+    def test_equal_but_differently_typed_inputs_not_shared(self):
+        evaluator = self.make_evaluator()
+
+        action_true, _ = evaluator.evaluate(Intent(name="q"), Context(), Evidence(facts={"verifiable": True}))
+        action_one, _ = evaluator.evaluate(Intent(name="q"), Context(), Evidence(facts={"verifiable": 1}))
+
+        assert action_true == DecisionAction.ALLOW
+        assert action_one is None
+
+    def test_unhashable_inputs_bypass_cache(self):
+        evaluator = self.make_evaluator()
+        evidence = Evidence(facts={"verifiable": [set()]})
+
+        action, _ = evaluator.evaluate(Intent(name="q"), Context(), evidence)
+
+        assert action is None
+        assert len(evaluator._cache) == 0
+
+    def test_cache_is_bounded_and_clearable(self):
+        evaluator = self.make_evaluator(cache_size=2)
+
+        for name in ("a", "b", "c"):
+            evaluator.evaluate(Intent(name=name), Context(), Evidence())
+
+        assert len(evaluator._cache) == 2
+        evaluator.clear_cache()
+        assert len(evaluator._cache) == 0
+
+
+class TestPolicyEvaluatorBatch:
+    """Tests for batch evaluation."""
+
+    @pytest.mark.parametrize("max_workers", [None, 4])
+    def test_evaluate_many_matches_evaluate(self, max_workers):
+        evaluator = PolicyEvaluator(
+            make_policy(
+                {"name": "refund", "conditions": {"intent.name": {"equals": "refund"}}, "action": "ESCALATE"},
+                {"name": "web", "conditions": {"context.channel": {"equals": "web"}}, "action": "RESTRICT"},
+            ),
+            cache_size=0,
+        )
+        records = [
+            (Intent(name=name), Context(channel=channel), Evidence())
+            for name in ("refund", "query")
+            for channel in ("web", "phone")
+        ] * 50
+
+        results = evaluator.evaluate_many(records, max_workers=max_workers)
+
+        assert results == [evaluator.evaluate(*record) for record in records]
+        assert results[:4] == [
+            (DecisionAction.ESCALATE, "Matched rule: refund"),
+            (DecisionAction.ESCALATE, "Matched rule: refund"),
+            (DecisionAction.RESTRICT, "Matched rule: web"),
+            (None, "No policy rules matched"),
+        ]
@@ -0,0 +1,177 @@
+"""
+Unit tests for the policy loader.
+"""
+
+import os
+
+import pytest
+import yaml
+from governance_gate.core.errors import PolicyError
+from governance_gate.policy.loader import PolicyLoader
+from governance_gate.policy.schema_validation import PolicyValidationError, validate_policy_schema
+
+pytestmark = pytest.mark.unit
+
+
+POLICY_YAML = """
+version: "1.0"
+name: {name}
+rules:
+  - name: refund
+    conditions:
+      intent.name:
+        equals: refund
+    action: ESCALATE
+"""
+
+
+@pytest.fixture
+def policy_file(tmp_path):
+    path = tmp_path / "policy.yaml"
+    path.write_text(POLICY_YAML.format(name="first"))
+    yield path
+    PolicyLoader.invalidate(path)
+
+
+class TestPolicyLoader:
+    """Tests for PolicyLoader."""
+
+    def test_load(self, policy_file):
+        policy = PolicyLoader(policy_file).load()
+
+        assert policy["name"] == "first"
+        assert policy["rules"][0]["action"] == "ESCALATE"
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(PolicyError):
+            PolicyLoader(tmp_path / "missing.yaml").load()
+
+    def test_unchanged_file_served_from_cache(self, policy_file):
+        first = PolicyLoader(policy_file).load()
+        second = PolicyLoader(policy_file).load()
+
+        assert second is first
+
+    def test_modified_file_reloaded(self, policy_file):
+        first = PolicyLoader(policy_file).load()
+        policy_file.write_text(POLICY_YAML.format(name="second_name"))
+        stat = policy_file.stat()
+        os.utime(policy_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = PolicyLoader(policy_file).load()
+
+        assert second is not first
+        assert second["name"] == "second_name"
+        assert list(PolicyLoader._cache).count(str(policy_file.resolve())) == 1
+
+    def test_cache_is_bounded(self, tmp_path, monkeypatch):
+        from governance_gate.policy import loader
+
+        monkeypatch.setattr(loader, "_POLICY_CACHE_SIZE", 2)
+        monkeypatch.setattr(PolicyLoader, "_cache", type(PolicyLoader._cache)())
+        paths = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.yaml"
+            path.write_text(POLICY_YAML.format(name=name))
+            paths.append(path)
+            PolicyLoader(path).load()
+
+        assert list(PolicyLoader._cache) == [str(path.resolve()) for path in paths[1:]]
+
+    def test_invalidate(self, policy_file):
+        first = PolicyLoader(policy_file).load()
+        PolicyLoader.invalidate(policy_file)
+
+        assert PolicyLoader(policy_file).load() is not first
+
+    @pytest.mark.parametrize(
+        "condition",
+        [
+            'gt: "high"',
+            "in: refund",
+            "is_true: 1",
+            "starts_with: 5",
+            'matches: "[a-"',
+            "between: 2",
+            'between: [1, "3"]',
+        ],
+    )
+    def test_operator_value_kind_enforced(self, condition):
+        content = POLICY_YAML.format(name="typed").replace("equals: refund", condition)
+
+        with pytest.raises(PolicyError):
+            PolicyLoader.load_from_string(content)
+
+    def test_between_rule_validates_and_matches(self):
+        from governance_gate.core.types import Context, DecisionAction, Evidence, Intent
+        from governance_gate.policy.evaluator import PolicyEvaluator
+
+        content = POLICY_YAML.format(name="ranged").replace(
+            "intent.name:\n        equals: refund", "evidence.facts.amount:\n        between: [1, 3]"
+        )
+        evaluator = PolicyEvaluator(PolicyLoader.load_from_string(content))
+
+        def action(amount):
+            return evaluator.evaluate(Intent(name="refund"), Context(), Evidence(facts={"amount": amount}))[0]
+
+        assert action(2) == DecisionAction.ESCALATE
+        assert action(3) == DecisionAction.ESCALATE
+        assert action(4) is None
+
+    def test_unchanged_content_validated_once(self, monkeypatch):
+        from governance_gate.policy import loader
+
+        calls = []
+        monkeypatch.setattr(loader, "validate_policy_schema", lambda policy, **kwargs: calls.append(policy))
+        content = POLICY_YAML.format(name="validated_once")
+
+        PolicyLoader.load_from_string(content)
+        PolicyLoader.load_from_string(content)
+        PolicyLoader.load_from_string(content.replace("validated_once", "changed"))
+
+        assert len(calls) == 2
+
+    def test_parse_yaml_matches_loader_without_validating(self):
+        content = POLICY_YAML.format(name="parsed")
+
+        assert PolicyLoader.parse_yaml(content.encode()) == PolicyLoader.load_from_string(content)
+        assert PolicyLoader.parse_yaml("rules: nope") == {"rules": "nope"}
+
+    def test_load_from_dict(self):
+        policy = yaml.safe_load(POLICY_YAML.format(name="composed"))
+
+        assert PolicyLoader.load_from_dict(policy) is policy
+
+        with pytest.raises(PolicyError):
+            PolicyLoader.load_from_dict({"name": "incomplete"})
+        with pytest.raises(PolicyError):
+            PolicyLoader.load_from_dict(["not", "a", "dict"])
+
+
+class TestValidatePolicySchema:
+    """Tests for schema validation modes."""
+
+    BAD_RULES = [{"name": "r1", "action": "NOPE"}, {"name": "r2", "action": "NOPE"}]
+
+    def test_collects_all_errors(self):
+        with pytest.raises(PolicyValidationError) as exc_info:
+            validate_policy_schema({"version": "1.0", "name": "bad", "rules": self.BAD_RULES})
+
+        assert len(exc_info.value.errors) == 4
+
+    def test_fast_fail_stops_at_first_invalid_rule(self):
+        with pytest.raises(PolicyValidationError) as exc_info:
+            validate_policy_schema(
+                {"version": "1.0", "name": "bad", "rules": self.BAD_RULES}, fast_fail=True
+            )
+
+        assert all(error.startswith("rules[0]") for error in exc_info.value.errors)
+
+    def test_fast_fail_stops_before_rules_on_top_level_errors(self):
+        with pytest.raises(PolicyValidationError) as exc_info:
+            validate_policy_schema({"version": 1, "rules": self.BAD_RULES}, fast_fail=True)
+
+        assert exc_info.value.errors == [
+            "Missing required top-level key: name",
+            "Policy version must be a string",
+        ]